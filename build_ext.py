@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""Optional Cython build for the heavy UI glue modules.
+
+The settings tab is hundreds of plain attribute stores and Qt property
+calls; compiling it removes the bytecode dispatch overhead without any
+code changes. Run:
+
+    python build_ext.py build_ext --inplace
+
+The compiled extension is loaded in preference to the .py file; when it
+is absent (or Cython/a compiler is not installed) the application runs
+the plain Python source unchanged.
+"""
+
+import sys
+
+try:
+    from setuptools import setup
+    from Cython.Build import cythonize
+except ImportError:
+    print("Cython build skipped: setuptools and Cython are required.")
+    sys.exit(0)
+
+setup(
+    name='securonis-download-manager-ext',
+    ext_modules=cythonize(
+        ['ui/settings_tab.py'],
+        # binding=True keeps compiled methods usable as PyQt slots;
+        # without it connections reject the extra bool arg from clicked
+        compiler_directives={'language_level': 3, 'binding': True}
+    )
+)
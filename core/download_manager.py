@@ -2,22 +2,63 @@
 # -*- coding: utf-8 -*-
 
 import os
+import re
+import math
 import time
-import uuid
+import secrets
+import itertools
 import threading
 import queue
+import collections
+import concurrent.futures
 import requests
+import urllib3
 import tempfile
 import shutil
 import hashlib
 from urllib.parse import urlparse, unquote
+from dataclasses import dataclass
+from requests.adapters import HTTPAdapter
 from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
 
+from core.iouring_writer import IoUringWriter, iouring_available
+
+# Network read size; large slices keep generator and allocation overhead low
+READ_CHUNK_SIZE = 1 << 20
+
+# Target size of one ranged request in a chunked download
+RANGE_UNIT_SIZE = 8 * 1024 * 1024
+
+# Filename in a Content-Disposition header, including the RFC 5987 form
+_CD_FILENAME_RE = re.compile(r'filename\*?=(?:UTF-8\'\')?"?([^";]+)', re.I)
+
+# Download IDs: one random base per process plus an atomic counter is far
+# cheaper than a uuid4 per download and yields shorter dict keys
+_ID_BASE = secrets.token_hex(4)
+_ID_COUNTER = itertools.count()
+
+@dataclass(frozen=True, slots=True)
+class DownloadSnapshot:
+    """Immutable copy of one download's UI-visible state
+
+    Worker threads keep mutating Download objects while the UI refreshes;
+    snapshots are taken in one pass under the downloads lock, so the GUI
+    thread never reads live fields and never sees a torn (size,
+    downloaded) pair. Slots make the per-row field reads cheap.
+    """
+    id: str
+    filename: str
+    size: int
+    downloaded: int
+    speed: float
+    status: str
+    url: str
+
 class Download:
     """Class representing a download task"""
     
     def __init__(self, url, target_dir, filename=None):
-        self.id = str(uuid.uuid4())
+        self.id = f"{_ID_BASE}-{next(_ID_COUNTER):x}"
         self.url = url
         self.target_dir = target_dir
         self.filename = filename or self._extract_filename(url)
@@ -31,11 +72,28 @@ class Download:
         self.status = "Waiting"
         self.error = None
         self.privacy_mode = "Normal"
+
+        # Speed currently counted in the manager's total-speed stat
+        self.counted_speed = 0.0
+
+        # Progress emission throttling state
+        self.last_emit_ts = 0.0
+        self.last_emit_bytes = 0
+
+        # Hash computed on the fly while writing (single-connection path)
+        self.hasher = None
+        self.computed_hash = None
         
         # For chunked downloads
         self.chunks = []
         self.chunk_status = {}
-    
+        self.progress_lock = threading.Lock()
+
+    def inc_downloaded(self, n):
+        """Atomically adds to the downloaded byte counter"""
+        with self.progress_lock:
+            self.downloaded += n
+
     def _extract_filename(self, url):
         """Extracts filename from URL"""
         parsed_url = urlparse(url)
@@ -91,7 +149,9 @@ class DownloadManager(QObject):
         self.max_downloads = settings_manager.get_setting('max_downloads', 3)
         self.speed_limit = settings_manager.get_setting('speed_limit', 0)
         self.chunk_enabled = settings_manager.get_setting('chunk_enabled', True)
-        self.chunk_count = settings_manager.get_setting('chunk_count', 4)
+        # Cap chunk parallelism so many simultaneous downloads cannot
+        # exhaust file descriptors and sockets
+        self.chunk_count = min(settings_manager.get_setting('chunk_count', 4), 16)
         self.chunk_min_size = settings_manager.get_setting('chunk_min_size', 10) * 1024 * 1024  # Convert MB to bytes
         self.auto_extract = settings_manager.get_setting('auto_extract', True)
         self.verify_hash = settings_manager.get_setting('verify_hash', True)
@@ -103,26 +163,76 @@ class DownloadManager(QObject):
         # Active downloads
         self.downloads = {}
         self.downloads_lock = threading.RLock()
+
+        # Stats counters, maintained incrementally on status and speed
+        # transitions so the UI never has to sum over the download list
+        self._stats_lock = threading.Lock()
+        self._active = 0
+        self._completed = 0
+        self._total_speed = 0.0
+
+        # Shared HTTP sessions keyed by privacy mode (keep-alive + connection pooling)
+        self.sessions = {}
+        self.sessions_lock = threading.Lock()
         
         # Download queue and workers
         self.download_queue = queue.Queue()
         self.active_workers = 0
         self.max_workers = self.max_downloads
-        self.workers = []
-        
-        # Start workers
-        self._start_workers()
-    
+
+        # Downloads run on a pool; a semaphore enforces max_workers so the
+        # pool itself can stay sized for the setting's upper bound
+        self.download_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=20,
+            thread_name_prefix='download'
+        )
+        self.download_slots = threading.Semaphore(self.max_workers)
+
+        # Low-level urllib3 pool for direct (non-proxied) range requests;
+        # skips requests' per-call Request/PreparedRequest construction
+        self.http = urllib3.PoolManager(
+            num_pools=16,
+            maxsize=self.max_workers * self.chunk_count,
+            block=False
+        )
+        self.http_timeout = urllib3.Timeout(
+            connect=self.connection_timeout,
+            read=self.connection_timeout
+        )
+
+        # One bounded pool shared by every chunked download
+        self.chunk_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self.max_workers * self.chunk_count,
+            thread_name_prefix='chunk'
+        )
+
+        # Dispatcher start is deferred to lazy_init so startup reaches
+        # first paint before any worker threads spawn
+        self._dispatcher = None
+
+    def lazy_init(self):
+        """Performs deferred startup work after the UI is shown"""
+        if self._dispatcher is None:
+            self._start_workers()
+
     def _start_workers(self):
-        """Starts download worker threads"""
-        for _ in range(self.max_workers):
-            worker = threading.Thread(target=self._download_worker)
-            worker.daemon = True
-            worker.start()
-            self.workers.append(worker)
+        """Starts the download dispatcher thread"""
+        self._dispatcher = threading.Thread(target=self._dispatch_downloads)
+        self._dispatcher.daemon = True
+        self._dispatcher.start()
+
+    def _dispatch_downloads(self):
+        """Feeds queued downloads to the pool, honoring max_workers"""
+        while True:
+            download_id = self.download_queue.get()
+            self.download_slots.acquire()
+            self.download_pool.submit(self._run_download, download_id)
     
     def add_download(self, url, target_dir, filename=None, privacy_mode="Normal"):
         """Adds a new download to the queue"""
+        # Make sure the dispatcher is up even if lazy_init has not run
+        self.lazy_init()
+
         download = Download(url, target_dir, filename)
         download.privacy_mode = privacy_mode
         download.status = "Waiting"
@@ -135,13 +245,48 @@ class DownloadManager(QObject):
         
         return download.id
     
+    def _set_status(self, download, status):
+        """Updates a download's status and the cached stats counters"""
+        with self._stats_lock:
+            old = download.status
+            download.status = status
+            if old == status:
+                return
+
+            if old == "Downloading":
+                self._active -= 1
+                self._total_speed -= download.counted_speed
+                download.counted_speed = 0.0
+            elif old == "Completed":
+                self._completed -= 1
+
+            if status == "Downloading":
+                self._active += 1
+            elif status == "Completed":
+                self._completed += 1
+
+    def _discard_stats(self, download):
+        """Removes a download's contribution before it leaves the list"""
+        with self._stats_lock:
+            if download.status == "Downloading":
+                self._active -= 1
+                self._total_speed -= download.counted_speed
+                download.counted_speed = 0.0
+            elif download.status == "Completed":
+                self._completed -= 1
+
+    def get_stats(self):
+        """Returns (active_count, completed_count, total_speed)"""
+        with self._stats_lock:
+            return self._active, self._completed, self._total_speed
+
     def pause_download(self, download_id):
         """Pauses a download"""
         with self.downloads_lock:
             if download_id in self.downloads:
                 download = self.downloads[download_id]
                 if download.status == "Downloading":
-                    download.status = "Paused"
+                    self._set_status(download, "Paused")
                     self.download_paused.emit(download_id)
                     return True
         return False
@@ -152,7 +297,7 @@ class DownloadManager(QObject):
             if download_id in self.downloads:
                 download = self.downloads[download_id]
                 if download.status == "Paused":
-                    download.status = "Waiting"
+                    self._set_status(download, "Waiting")
                     self.download_queue.put(download_id)
                     self.download_resumed.emit(download_id)
                     return True
@@ -164,7 +309,7 @@ class DownloadManager(QObject):
             if download_id in self.downloads:
                 download = self.downloads[download_id]
                 if download.status in ["Downloading", "Paused", "Waiting"]:
-                    download.status = "Canceled"
+                    self._set_status(download, "Canceled")
                     self.download_canceled.emit(download_id)
                     return True
         return False
@@ -180,6 +325,7 @@ class DownloadManager(QObject):
                     self.cancel_download(download_id)
                 
                 # Delete from list
+                self._discard_stats(download)
                 del self.downloads[download_id]
                 return True
         return False
@@ -195,6 +341,7 @@ class DownloadManager(QObject):
                             if d.status == "Completed"]
             
             for download_id in completed_ids:
+                self._discard_stats(self.downloads[download_id])
                 del self.downloads[download_id]
     
     def get_download(self, download_id):
@@ -216,60 +363,88 @@ class DownloadManager(QObject):
         """Lists all downloads"""
         with self.downloads_lock:
             return list(self.downloads.values())
+
+    def get_snapshots(self):
+        """Returns immutable per-download snapshots for the UI"""
+        with self.downloads_lock:
+            return [
+                DownloadSnapshot(d.id, d.filename, d.size, d.downloaded,
+                                 d.speed, d.status, d.url)
+                for d in self.downloads.values()
+            ]
     
-    def _download_worker(self):
-        """Background thread to process download operations"""
-        while True:
+    def _run_download(self, download_id):
+        """Processes one queued download on the pool"""
+        try:
+            with self.downloads_lock:
+                if download_id not in self.downloads:
+                    return
+
+                download = self.downloads[download_id]
+
+                # Skip if download is canceled or completed
+                if download.status in ["Canceled", "Completed", "Failed"]:
+                    return
+
+                # Mark as downloading
+                self._set_status(download, "Downloading")
+                self.active_workers += 1
+
+            self.download_started.emit(download_id)
+
+            # Perform the download
             try:
-                # Get next download ID from queue
-                download_id = self.download_queue.get()
-                
-                with self.downloads_lock:
-                    if download_id not in self.downloads:
-                        self.download_queue.task_done()
-                        continue
-                    
-                    download = self.downloads[download_id]
-                    
-                    # Skip if download is canceled or completed
-                    if download.status in ["Canceled", "Completed", "Failed"]:
-                        self.download_queue.task_done()
-                        continue
-                    
-                    # Mark as downloading
-                    download.status = "Downloading"
-                    self.active_workers += 1
-                
-                self.download_started.emit(download_id)
-                
-                # Perform the download
-                try:
-                    success = self._download_file(download_id)
-                    
-                    with self.downloads_lock:
-                        if download_id in self.downloads:
-                            if success:
-                                self.downloads[download_id].status = "Completed"
-                                self.download_completed.emit(download_id)
-                            else:
-                                # If paused/canceled, don't change status to failed
-                                if self.downloads[download_id].status == "Downloading":
-                                    self.downloads[download_id].status = "Failed"
-                                    self.download_failed.emit(download_id, self.downloads[download_id].error or "Unknown error")
-                except Exception as e:
-                    with self.downloads_lock:
-                        if download_id in self.downloads:
-                            self.downloads[download_id].status = "Failed"
-                            self.downloads[download_id].error = str(e)
-                            self.download_failed.emit(download_id, str(e))
-                
+                success = self._download_file(download_id)
+
                 with self.downloads_lock:
-                    self.active_workers -= 1
-                
-                self.download_queue.task_done()
+                    if download_id in self.downloads:
+                        if success:
+                            self._set_status(self.downloads[download_id], "Completed")
+                            self.download_completed.emit(download_id)
+                        else:
+                            # If paused/canceled, don't change status to failed
+                            if self.downloads[download_id].status == "Downloading":
+                                self._set_status(self.downloads[download_id], "Failed")
+                                self.download_failed.emit(download_id, self.downloads[download_id].error or "Unknown error")
             except Exception as e:
-                print(f"Error in download worker: {str(e)}")
+                with self.downloads_lock:
+                    if download_id in self.downloads:
+                        self._set_status(self.downloads[download_id], "Failed")
+                        self.downloads[download_id].error = str(e)
+                        self.download_failed.emit(download_id, str(e))
+
+            with self.downloads_lock:
+                self.active_workers -= 1
+        except Exception as e:
+            print(f"Error in download worker: {str(e)}")
+        finally:
+            self.download_slots.release()
+            self.download_queue.task_done()
     
+    def _get_session(self, privacy_mode):
+        """Returns a shared requests.Session for the given privacy mode"""
+        with self.sessions_lock:
+            session = self.sessions.get(privacy_mode)
+            if session is None:
+                session = requests.Session()
+
+                # Pool enough connections for all chunk workers to reuse sockets
+                adapter = HTTPAdapter(
+                    pool_connections=self.max_workers,
+                    pool_maxsize=self.max_workers * self.chunk_count,
+                    pool_block=False,
+                    max_retries=0
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+
+                # Proxy and Tor settings
+                session.proxies = self._get_proxies(privacy_mode)
+
+                self.sessions[privacy_mode] = session
+
+        return session
+
     def _download_file(self, download_id):
         """Downloads a specific file"""
         try:
@@ -277,52 +452,77 @@ class DownloadManager(QObject):
                 if download_id not in self.downloads:
                     return
                 download = self.downloads[download_id]
-            
+
             # Download start time
             download.start_time = time.time()
-            
-            # Proxy and Tor settings
-            proxies = self._get_proxies(download.privacy_mode)
-            
-            # HTTP Headers
+
+            # Every attempt restarts from byte zero, so the incremental
+            # counter and the emission throttle must restart with it; a
+            # resume would otherwise keep counting on top of the first
+            # attempt's bytes and overshoot the file size
+            with download.progress_lock:
+                download.downloaded = 0
+            download.last_emit_bytes = 0
+            for chunk in download.chunks:
+                chunk['downloaded'] = 0
+
+            # Shared session for this privacy mode (keeps sockets alive between requests)
+            session = self._get_session(download.privacy_mode)
+
+            # HTTP Headers, built once per download; identity encoding keeps
+            # ranged requests byte-addressable (no gzip re-encoding)
             headers = self._get_headers()
-            
-            # HEAD request for file information
-            head_response = requests.head(
-                download.url, 
-                headers=headers,
-                proxies=proxies,
+            headers['Accept-Encoding'] = 'identity'
+
+            # Single ranged GET probe instead of a HEAD + GET round-trip; the
+            # response proves range support and carries the total size at once
+            probe_response = session.get(
+                download.url,
+                headers={**headers, 'Range': 'bytes=0-0'},
+                stream=True,
                 timeout=self.connection_timeout,
                 allow_redirects=True
             )
-            
+
+            # Check if supports range requests (206 means the range was honored)
+            supports_range = probe_response.status_code == 206
+
             # File size
-            content_length = head_response.headers.get('content-length')
-            if content_length and content_length.isdigit():
-                download.size = int(content_length)
-            
+            if supports_range:
+                content_range = probe_response.headers.get('content-range', '')
+                range_match = re.match(r'bytes \d+-\d+/(\d+)', content_range)
+                if range_match:
+                    download.size = int(range_match.group(1))
+            else:
+                content_length = probe_response.headers.get('content-length')
+                if content_length and content_length.isdigit():
+                    download.size = int(content_length)
+
             # Get real filename (if provided by server)
-            content_disposition = head_response.headers.get('content-disposition')
+            content_disposition = probe_response.headers.get('content-disposition')
             if content_disposition:
-                import re
-                filename_match = re.search(r'filename="?([^";]+)', content_disposition)
+                filename_match = _CD_FILENAME_RE.search(content_disposition)
                 if filename_match:
-                    download.filename = filename_match.group(1)
-            
+                    download.filename = unquote(filename_match.group(1))
+
             # Check download URL (if redirected)
-            download.url = head_response.url
-            
+            download.url = probe_response.url
+
             # Target file path
             target_path = download.get_target_path()
-            
-            # Check if supports range requests
-            supports_range = 'accept-ranges' in head_response.headers and head_response.headers['accept-ranges'] == 'bytes'
-            
+
             # Use chunked download if supported and enabled
             if supports_range and self.chunk_enabled and download.size >= self.chunk_min_size:
-                return self._download_in_chunks(download, proxies, headers)
+                probe_response.close()
+                return self._download_in_chunks(download, session, headers)
+            elif probe_response.status_code == 200:
+                # Server ignored the range and is already streaming the full
+                # body - keep downloading on the open connection
+                return self._download_single(download, session, headers,
+                                             response=probe_response)
             else:
-                return self._download_single(download, proxies, headers)
+                probe_response.close()
+                return self._download_single(download, session, headers)
         except Exception as e:
             with self.downloads_lock:
                 if download_id in self.downloads:
@@ -330,61 +530,107 @@ class DownloadManager(QObject):
             print(f"Error downloading file: {str(e)}")
             return False
     
-    def _download_single(self, download, proxies, headers):
+    def _download_single(self, download, session, headers, response=None):
         """Single connection download strategy"""
         target_path = download.get_target_path()
-        temp_path = target_path + ".part"
-        
-        # Check if file exists
-        if os.path.exists(target_path):
-            # Handle file conflicts based on settings
-            if self.file_conflict == "Skip download":
-                return True
-            elif self.file_conflict == "Overwrite":
-                pass  # Just overwrite
-            elif self.file_conflict == "Auto rename":
-                base, ext = os.path.splitext(target_path)
-                counter = 1
-                while os.path.exists(target_path):
-                    target_path = f"{base} ({counter}){ext}"
-                    counter += 1
-                download.filename = os.path.basename(target_path)
-        
+
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        
+
+        # Atomically claim the final name; the placeholder also keeps other
+        # downloads from racing for it while we stream into the .part file
+        reserved_fd, target_path = self._reserve_target_fd(target_path)
+        if reserved_fd is None:
+            return True
+        os.close(reserved_fd)
+        download.filename = os.path.basename(target_path)
+
+        temp_path = target_path + ".part"
+        succeeded = False
+        try:
+            succeeded = self._download_single_attempts(download, session, headers,
+                                                       response, target_path, temp_path)
+            return succeeded
+        finally:
+            # Drop the empty placeholder if the download didn't finish, so a
+            # later resume can claim the original name again
+            if not succeeded:
+                try:
+                    if os.path.getsize(target_path) == 0:
+                        os.remove(target_path)
+                except OSError:
+                    pass
+
+    def _download_single_attempts(self, download, session, headers, response,
+                                  target_path, temp_path):
+        """Runs the retry loop for a single-connection download"""
         # Try to download with retries
         retries = 0
         while retries <= self.retry_count:
             try:
-                with requests.get(
-                    download.url, 
-                    headers=headers,
-                    proxies=proxies,
-                    stream=True,
-                    timeout=self.connection_timeout
-                ) as response:
+                # Reuse the already-open probe response on the first attempt
+                if response is None:
+                    response = session.get(
+                        download.url,
+                        headers=headers,
+                        stream=True,
+                        timeout=self.connection_timeout
+                    )
+
+                try:
                     response.raise_for_status()
-                    
-                    with open(temp_path, 'wb') as f:
-                        for chunk in response.iter_content(chunk_size=8192):
+
+                    # Hash while writing so verification needs no second read
+                    download.hasher = hashlib.sha256()
+                    download.computed_hash = None
+
+                    fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    try:
+                        # Pre-size the file and declare sequential access so
+                        # the filesystem avoids incremental extends
+                        if download.size > 0 and hasattr(os, 'posix_fallocate'):
+                            os.posix_fallocate(fd, 0, download.size)
+                        if download.size > 0 and hasattr(os, 'posix_fadvise'):
+                            os.posix_fadvise(fd, 0, download.size, os.POSIX_FADV_SEQUENTIAL)
+
+                        # Coalesce small network chunks and flush them with a
+                        # single scatter-gather syscall per batch
+                        pending = []
+                        pending_bytes = 0
+
+                        for chunk in response.iter_content(chunk_size=READ_CHUNK_SIZE):
                             # Check if download is paused or canceled
                             if download.status != "Downloading":
                                 return False
-                            
+
                             if chunk:
-                                f.write(chunk)
+                                download.hasher.update(chunk)
+                                pending.append(chunk)
+                                pending_bytes += len(chunk)
+                                if pending_bytes >= 256 * 1024:
+                                    self._flush_buffers(fd, pending)
+                                    pending = []
+                                    pending_bytes = 0
+
                                 download.downloaded += len(chunk)
-                                download.calculate_progress()
-                                
-                                # Calculate speed
-                                elapsed = time.time() - download.start_time
-                                download.calculate_speed(elapsed)
-                                
-                                # Send progress signal
-                                self.download_progress.emit(download.id, download.downloaded, download.size)
-                
+                                self._maybe_emit_progress(download)
+
+                        if pending:
+                            self._flush_buffers(fd, pending)
+
+                        self._maybe_emit_progress(download, force=True)
+                    finally:
+                        # Downloaded bytes are read back at most once; let the
+                        # kernel reclaim their page cache right away
+                        if hasattr(os, 'posix_fadvise'):
+                            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                        os.close(fd)
+                finally:
+                    response.close()
+                    response = None
+
                 # Download completed, move temp file to target
+                download.computed_hash = download.hasher.hexdigest()
                 shutil.move(temp_path, target_path)
                 
                 # Post-processing
@@ -405,133 +651,203 @@ class DownloadManager(QObject):
         
         return False
     
-    def _download_in_chunks(self, download, proxies, headers):
+    def _download_in_chunks(self, download, session, headers):
         """Chunked download strategy"""
         target_path = download.get_target_path()
-        
-        # Check if file exists and handle conflicts
-        if os.path.exists(target_path):
-            # Handle file conflicts based on settings
-            if self.file_conflict == "Skip download":
-                return True
-            elif self.file_conflict == "Overwrite":
-                pass  # Just overwrite
-            elif self.file_conflict == "Auto rename":
-                base, ext = os.path.splitext(target_path)
-                counter = 1
-                while os.path.exists(target_path):
-                    target_path = f"{base} ({counter}){ext}"
-                    counter += 1
-                download.filename = os.path.basename(target_path)
-        
+
         # Create directory if it doesn't exist
         os.makedirs(os.path.dirname(target_path), exist_ok=True)
+
+        # Atomically claim the final name; all data goes to side files that
+        # replace the target only on success, so an overwritten file
+        # survives a failed or canceled download
+        reserved_fd, target_path = self._reserve_target_fd(target_path)
+        if reserved_fd is None:
+            return True
+        os.close(reserved_fd)
+        download.filename = os.path.basename(target_path)
+        part_path = target_path + ".part"
         
-        # Prepare chunks
-        chunk_size = download.size // self.chunk_count
+        # Split into ~8 MiB units: small files don't fan out into many tiny
+        # requests and large ones produce enough ranges to keep workers busy
+        count = max(1, math.ceil(download.size / RANGE_UNIT_SIZE))
+        if download.size // count < self.chunk_min_size:
+            count = max(1, download.size // self.chunk_min_size)
+        chunk_size = math.ceil(download.size / count)
         chunks = []
-        
-        for i in range(self.chunk_count):
+
+        # Write every chunk directly into one preallocated file where the
+        # platform supports it; fall back to temp files plus a merge pass
+        use_pwrite = hasattr(os, 'pwrite') and hasattr(os, 'posix_fallocate')
+
+        for i in range(count):
             start = i * chunk_size
-            end = start + chunk_size - 1 if i < self.chunk_count - 1 else download.size - 1
-            
-            temp_file = f"{target_path}.part{i}"
-            chunks.append({
+            end = min(start + chunk_size - 1, download.size - 1)
+
+            chunk = {
                 'start': start,
                 'end': end,
-                'temp_file': temp_file,
                 'downloaded': 0,
                 'status': 'waiting'
-            })
-        
+            }
+            if not use_pwrite:
+                chunk['temp_file'] = f"{target_path}.part{i}"
+            chunks.append(chunk)
+
         download.chunks = chunks
-        
-        # Create threads for each chunk
-        chunk_threads = []
-        for i, chunk in enumerate(chunks):
-            thread = threading.Thread(
-                target=self._download_chunk, 
-                args=(download, chunk, proxies, headers.copy())
-            )
-            thread.daemon = True
-            thread.start()
-            chunk_threads.append(thread)
-        
-        # Wait for all chunks to complete
-        for thread in chunk_threads:
-            thread.join()
-        
+
+        fd = -1
+        writer = None
+        try:
+            if use_pwrite:
+                # Preallocate the side file once to avoid fragmentation
+                # and the extra full-file write of a merge pass
+                fd = os.open(part_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                os.posix_fallocate(fd, 0, download.size)
+                if hasattr(os, 'posix_fadvise'):
+                    os.posix_fadvise(fd, 0, download.size, os.POSIX_FADV_SEQUENTIAL)
+
+                # Batch writes through io_uring when the binding is available
+                if iouring_available():
+                    writer = IoUringWriter(fd)
+
+            # Keep at most chunk_count ranges in flight; the next range is
+            # submitted as soon as any running one finishes, so the network
+            # stays saturated without opening every connection at once
+            remaining = collections.deque(chunks)
+            inflight = set()
+
+            def submit_next():
+                chunk = remaining.popleft()
+                inflight.add(self.chunk_pool.submit(
+                    self._download_chunk,
+                    download, chunk, session, headers, fd, writer
+                ))
+
+            while remaining and len(inflight) < self.chunk_count:
+                submit_next()
+
+            while inflight:
+                done, inflight = concurrent.futures.wait(
+                    inflight, return_when=concurrent.futures.FIRST_COMPLETED)
+
+                # Abort early on pause/cancel
+                if download.status != "Downloading":
+                    remaining.clear()
+
+                while remaining and len(inflight) < self.chunk_count:
+                    submit_next()
+        finally:
+            try:
+                if writer is not None:
+                    writer.close()
+            finally:
+                if fd >= 0:
+                    # Free the page cache taken by the written data
+                    if hasattr(os, 'posix_fadvise'):
+                        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+                    os.close(fd)
+
         # Check if all chunks completed successfully
         if all(chunk['status'] == 'completed' for chunk in chunks):
-            # Combine chunks
-            with open(target_path, 'wb') as output:
+            if use_pwrite:
+                # Clobber the claimed name only now that every byte is in
+                os.replace(part_path, target_path)
+            else:
+                # Combine chunks
+                self._merge_chunk_files(chunks, target_path)
+
+                # Clean up temp files
                 for chunk in chunks:
-                    with open(chunk['temp_file'], 'rb') as input:
-                        shutil.copyfileobj(input, output)
-            
-            # Clean up temp files
-            for chunk in chunks:
-                if os.path.exists(chunk['temp_file']):
-                    os.remove(chunk['temp_file'])
-            
+                    if os.path.exists(chunk['temp_file']):
+                        os.remove(chunk['temp_file'])
+
             # Post-processing
             self._post_process_download(download, target_path)
-            
+
             return True
         else:
             # Download failed
             download.error = "Some chunks failed to download"
-            
-            # Clean up temp files
-            for chunk in chunks:
-                if os.path.exists(chunk['temp_file']):
-                    os.remove(chunk['temp_file'])
-            
+
+            # Clean up partial output
+            if use_pwrite and os.path.exists(part_path):
+                os.remove(part_path)
+            if not use_pwrite:
+                for chunk in chunks:
+                    if os.path.exists(chunk['temp_file']):
+                        os.remove(chunk['temp_file'])
+
+            # Drop the claimed name only if it is an empty placeholder,
+            # never a pre-existing file kept under the overwrite policy
+            try:
+                if os.path.getsize(target_path) == 0:
+                    os.remove(target_path)
+            except OSError:
+                pass
+
             return False
     
-    def _download_chunk(self, download, chunk, proxies, headers):
+    def _download_chunk(self, download, chunk, session, headers, fd=-1, writer=None):
         """Downloads a single chunk of a file"""
         retries = 0
         while retries <= self.retry_count:
             try:
-                # Add range header for this chunk
-                headers['Range'] = f"bytes={chunk['start']}-{chunk['end']}"
-                
+                # The shared base headers are never mutated; each request gets
+                # its own dict with the range stamped in
+                req_headers = {**headers, 'Range': f"bytes={chunk['start']}-{chunk['end']}"}
+
                 chunk['status'] = 'downloading'
-                
-                with requests.get(
-                    download.url, 
-                    headers=headers,
-                    proxies=proxies,
-                    stream=True,
-                    timeout=self.connection_timeout
-                ) as response:
-                    response.raise_for_status()
-                    
-                    with open(chunk['temp_file'], 'wb') as f:
-                        for data in response.iter_content(chunk_size=8192):
+
+                response = self._open_range_stream(session, download.url, req_headers)
+                completed = False
+                try:
+                    offset = chunk['start']
+                    temp_f = None if fd >= 0 else open(chunk['temp_file'], 'wb')
+                    try:
+                        # One reusable buffer per worker; readinto avoids a
+                        # fresh bytes allocation for every network read
+                        buf = bytearray(READ_CHUNK_SIZE)
+                        mv = memoryview(buf)
+
+                        while True:
                             # Check if download is paused or canceled
                             if download.status != "Downloading":
                                 return
-                            
-                            if data:
-                                f.write(data)
-                                chunk['downloaded'] += len(data)
-                                
-                                # Update total downloaded amount
-                                with self.downloads_lock:
-                                    download.downloaded = sum(c['downloaded'] for c in download.chunks)
-                                    download.calculate_progress()
-                                    
-                                    # Calculate speed
-                                    elapsed = time.time() - download.start_time
-                                    download.calculate_speed(elapsed)
-                                
-                                # Send progress signal
-                                self.download_progress.emit(download.id, download.downloaded, download.size)
-                
+
+                            n = response.readinto(mv)
+                            if not n:
+                                completed = True
+                                break
+
+                            if fd >= 0:
+                                # Write straight into the preallocated target
+                                # at this chunk's offset - no temp file
+                                if writer is not None:
+                                    writer.write(mv[:n], offset)
+                                else:
+                                    os.pwrite(fd, mv[:n], offset)
+                                offset += n
+                            else:
+                                temp_f.write(mv[:n])
+
+                            chunk['downloaded'] += n
+                            download.inc_downloaded(n)
+                            self._maybe_emit_progress(download)
+                    finally:
+                        if temp_f is not None:
+                            temp_f.close()
+                finally:
+                    # Fully drained connections go back to the pool; aborted
+                    # ones are closed so a half-read socket is never reused
+                    if completed:
+                        response.release_conn()
+                    else:
+                        response.close()
+
                 # Chunk successfully downloaded
                 chunk['status'] = 'completed'
+                self._maybe_emit_progress(download, force=True)
                 return
                 
             except Exception as e:
@@ -544,21 +860,172 @@ class DownloadManager(QObject):
                 # Wait before retry
                 time.sleep(self.retry_delay)
     
+    def _reserve_target_fd(self, target_path):
+        """Atomically claims the target path, honoring the conflict policy.
+
+        Returns (fd, final_path) with fd opened for writing. Returns
+        (None, target_path) when an existing file should be kept. The
+        O_CREAT|O_EXCL probe both detects and claims each candidate name in
+        one syscall, so two downloads can never pick the same name.
+        """
+        if self.file_conflict == "Skip download" and os.path.exists(target_path):
+            return None, target_path
+
+        if self.file_conflict != "Auto rename":
+            # "Overwrite" (and legacy modes) claim the name without
+            # truncating; the existing file is only replaced once the
+            # finished download moves over it
+            fd = os.open(target_path, os.O_WRONLY | os.O_CREAT, 0o644)
+            return fd, target_path
+
+        base, ext = os.path.splitext(target_path)
+        counter = 1
+        candidate = target_path
+        while True:
+            try:
+                fd = os.open(candidate, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+                return fd, candidate
+            except FileExistsError:
+                candidate = f"{base} ({counter}){ext}"
+                counter += 1
+
+    def _open_range_stream(self, session, url, req_headers):
+        """Opens a streaming GET, returning the raw urllib3 response.
+
+        Direct connections go through the urllib3 PoolManager to avoid the
+        Request/PreparedRequest churn of requests; proxied/Tor traffic keeps
+        using the privacy-mode session.
+        """
+        if not session.proxies:
+            response = self.http.request(
+                'GET', url,
+                headers=req_headers,
+                preload_content=False,
+                # Follow redirects like the requests path does; error
+                # retries stay with the chunk retry loop
+                retries=urllib3.Retry(redirect=5, connect=0, read=0,
+                                      status=0, other=0),
+                timeout=self.http_timeout
+            )
+            if response.status != 206:
+                # Anything but partial content - an error, or a server
+                # ignoring the Range header - would be written at the
+                # chunk offset and silently corrupt the file
+                response.close()
+                raise requests.HTTPError(
+                    f"Expected partial content, got {response.status} for url: {url}")
+            return response
+
+        response = session.get(
+            url,
+            headers=req_headers,
+            stream=True,
+            timeout=self.connection_timeout
+        )
+        response.raise_for_status()
+        if response.status_code != 206:
+            response.close()
+            raise requests.HTTPError(
+                f"Expected partial content, got {response.status_code} for url: {url}")
+        return response.raw
+
+    def _flush_buffers(self, fd, buffers):
+        """Writes a batch of buffers with one syscall where possible"""
+        if hasattr(os, 'writev'):
+            expected = sum(len(b) for b in buffers)
+            written = os.writev(fd, buffers)
+            if written < expected:
+                # Rare partial write - finish with plain writes
+                rest = memoryview(b''.join(buffers))[written:]
+                while rest:
+                    rest = rest[os.write(fd, rest):]
+        else:
+            os.write(fd, b''.join(buffers))
+
+    def _merge_chunk_files(self, chunks, target_path):
+        """Combines chunk temp files into the final target file"""
+        if hasattr(os, 'sendfile'):
+            # In-kernel copy - no byte round-trips through Python objects
+            out_fd = os.open(target_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                for chunk in chunks:
+                    in_fd = os.open(chunk['temp_file'], os.O_RDONLY)
+                    try:
+                        size = os.fstat(in_fd).st_size
+                        offset = 0
+                        while offset < size:
+                            sent = os.sendfile(out_fd, in_fd, offset, size - offset)
+                            if sent == 0:
+                                break
+                            offset += sent
+                    finally:
+                        os.close(in_fd)
+            finally:
+                os.close(out_fd)
+        else:
+            # Userspace copy fallback (Windows)
+            with open(target_path, 'wb') as output:
+                for chunk in chunks:
+                    with open(chunk['temp_file'], 'rb') as input:
+                        shutil.copyfileobj(input, output)
+
+    def _maybe_emit_progress(self, download, force=False):
+        """Emits a progress signal at a bounded rate (10 Hz / 0.5% steps)"""
+        now = time.time()
+        if not force:
+            min_delta = download.size / 200 if download.size > 0 else 256 * 1024
+            if (now - download.last_emit_ts < 0.1
+                    and download.downloaded - download.last_emit_bytes < min_delta):
+                return
+
+        download.calculate_progress()
+        download.calculate_speed(now - download.start_time)
+
+        # Fold the speed change into the running total as a delta
+        with self._stats_lock:
+            if download.status == "Downloading":
+                self._total_speed += download.speed - download.counted_speed
+                download.counted_speed = download.speed
+
+        download.last_emit_ts = now
+        download.last_emit_bytes = download.downloaded
+
+        self.download_progress.emit(download.id, download.downloaded, download.size)
+
     def _post_process_download(self, download, file_path):
         """Performs post-processing on downloaded file"""
         # Verify hash if available and enabled
         if self.verify_hash and hasattr(download, 'expected_hash'):
-            self._verify_file_hash(file_path, download.expected_hash)
+            self._verify_file_hash(download, file_path)
         
         # Auto-extract archives
         if self.auto_extract and self._is_archive(file_path):
             self._extract_archive(file_path, os.path.dirname(file_path))
     
-    def _verify_file_hash(self, file_path, expected_hash):
+    def _verify_file_hash(self, download, file_path):
         """Verifies file integrity using hash"""
-        # This should verify different hash types (MD5, SHA1, SHA256)
-        # Implementation not complete
-        pass
+        expected_hash = download.expected_hash.lower()
+
+        # Pick the algorithm from the digest length (MD5, SHA1, SHA256)
+        algorithms = {32: 'md5', 40: 'sha1', 64: 'sha256'}
+        algorithm = algorithms.get(len(expected_hash))
+        if algorithm is None:
+            return True
+
+        if algorithm == 'sha256' and download.computed_hash is not None:
+            # Already hashed on the fly while writing - no extra read pass
+            actual_hash = download.computed_hash
+        else:
+            hasher = hashlib.new(algorithm)
+            with open(file_path, 'rb') as f:
+                for block in iter(lambda: f.read(READ_CHUNK_SIZE), b''):
+                    hasher.update(block)
+            actual_hash = hasher.hexdigest()
+
+        if actual_hash != expected_hash:
+            download.error = "Hash verification failed"
+            return False
+        return True
     
     def _is_archive(self, file_path):
         """Checks if file is an archive that can be extracted"""
@@ -619,5 +1086,8 @@ class DownloadManager(QObject):
         send_referer = self.settings_manager.get_setting('send_referer', True)
         if not send_referer:
             headers['Referer'] = ''
-        
+
+        # Keep connections open so pooled sockets can be reused
+        headers['Connection'] = 'keep-alive'
+
         return headers 
\ No newline at end of file
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+import os
+import queue
+import threading
+
+# Optional liburing binding; the writer is only used when it imports
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Ring and buffer geometry
+QUEUE_DEPTH = 256
+BUFFER_SIZE = 1024 * 1024
+BUFFER_COUNT = 64
+MAX_BATCH = 32
+
+
+def iouring_available(min_kernel=(5, 6)):
+    """Checks whether io_uring can be used on this system
+
+    min_kernel is the oldest kernel supporting the opcodes the caller
+    needs; 5.6 covers the write path, unlinkat arrived in 5.11.
+    """
+    if liburing is None:
+        return False
+
+    if not hasattr(os, 'uname'):
+        return False
+    try:
+        release = os.uname().release.split('-')[0]
+        major, minor = (int(part) for part in release.split('.')[:2])
+        return (major, minor) >= min_kernel
+    except (ValueError, OSError):
+        return False
+
+
+def batch_unlink(paths):
+    """Unlinks many files through batched io_uring submissions
+
+    Returns True when the batch ran through io_uring; callers should
+    fall back to plain os.unlink when this returns False. Per-file
+    failures (already-gone files and the like) are ignored, matching
+    the unlink-quietly semantics of the cleanup paths that use this.
+    """
+    if not iouring_available(min_kernel=(5, 11)):
+        return False
+
+    at_fdcwd = getattr(liburing, 'AT_FDCWD', -100)
+    ring = liburing.io_uring()
+    liburing.io_uring_queue_init(128, ring, 0)
+    try:
+        cqe = liburing.io_uring_cqe()
+        submitted = 0
+        completed = 0
+
+        # Paths must stay alive until their SQE completes
+        encoded = [os.fsencode(path) for path in paths]
+        for path in encoded:
+            sqe = liburing.io_uring_get_sqe(ring)
+            while sqe is None:
+                # Queue full: flush and drain one completion
+                liburing.io_uring_submit(ring)
+                liburing.io_uring_wait_cqe(ring, cqe)
+                liburing.io_uring_cqe_seen(ring, cqe)
+                completed += 1
+                sqe = liburing.io_uring_get_sqe(ring)
+
+            liburing.io_uring_prep_unlinkat(sqe, at_fdcwd, path, 0)
+            submitted += 1
+
+        liburing.io_uring_submit(ring)
+        while completed < submitted:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            liburing.io_uring_cqe_seen(ring, cqe)
+            completed += 1
+        return True
+    except Exception:
+        # Anything unexpected from the binding: let the caller fall
+        # back to the portable path
+        return False
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+
+class IoUringWriter:
+    """Batches positional file writes through a Linux io_uring queue.
+
+    Incoming data is copied into pre-registered buffers and submitted as
+    write SQEs against a registered fd, so many small network chunks turn
+    into a handful of io_uring_enter calls. Completions are reaped on a
+    daemon thread which recycles the buffers.
+    """
+
+    def __init__(self, fd):
+        self.fd = fd
+        self.closed = False
+        self.error = None
+
+        self.ring = liburing.io_uring()
+        liburing.io_uring_queue_init(QUEUE_DEPTH, self.ring, 0)
+
+        # Register the target fd so SQEs can reference it by index
+        liburing.io_uring_register_files(self.ring, [fd])
+
+        # Fixed buffers the kernel can DMA from directly
+        self.buffers = [bytearray(BUFFER_SIZE) for _ in range(BUFFER_COUNT)]
+        self.iovecs = liburing.iovec(*self.buffers)
+        liburing.io_uring_register_buffers(self.ring, self.iovecs)
+
+        # Buffer indices not currently in flight
+        self.free_buffers = queue.Queue()
+        for index in range(BUFFER_COUNT):
+            self.free_buffers.put(index)
+
+        # Byte count submitted with each in-flight buffer, so the reaper
+        # can tell a short write from a completed one
+        self.buffer_lengths = [0] * BUFFER_COUNT
+
+        self.submit_lock = threading.Lock()
+        self.pending = 0
+        self.inflight = 0
+
+        # Reap completions in the background and recycle buffers
+        self.reaper = threading.Thread(target=self._reap_completions)
+        self.reaper.daemon = True
+        self.reaper.start()
+
+    def write(self, data, offset):
+        """Queues data to be written at the given file offset"""
+        if self.error is not None:
+            raise self.error
+
+        view = memoryview(data)
+        while view:
+            part = view[:BUFFER_SIZE]
+            buf_index = self.free_buffers.get()
+            self.buffers[buf_index][:len(part)] = part
+            self.buffer_lengths[buf_index] = len(part)
+
+            with self.submit_lock:
+                sqe = liburing.io_uring_get_sqe(self.ring)
+                liburing.io_uring_prep_write_fixed(
+                    sqe, 0, self.iovecs[buf_index].iov_base, len(part),
+                    offset, buf_index
+                )
+                sqe.flags |= liburing.IOSQE_FIXED_FILE
+                liburing.io_uring_sqe_set_data64(sqe, buf_index)
+
+                self.pending += 1
+                self.inflight += 1
+                if self.pending >= MAX_BATCH:
+                    liburing.io_uring_submit(self.ring)
+                    self.pending = 0
+
+            offset += len(part)
+            view = view[len(part):]
+
+    def _reap_completions(self):
+        cqe = liburing.io_uring_cqe()
+        while True:
+            try:
+                liburing.io_uring_wait_cqe(self.ring, cqe)
+            except BlockingIOError:
+                continue
+
+            res = cqe.res
+            buf_index = liburing.io_uring_cqe_get_data64(cqe)
+            liburing.io_uring_cqe_seen(self.ring, cqe)
+
+            # close() posts a NOP tagged past the buffer range once all
+            # writes are done; it is the shutdown signal
+            if buf_index >= BUFFER_COUNT:
+                return
+
+            if res < 0:
+                if self.error is None:
+                    self.error = OSError(-res, os.strerror(-res))
+            elif res < self.buffer_lengths[buf_index] and self.error is None:
+                # A short write would leave a hole at this buffer's fixed
+                # offset; surface it like a failed write instead of
+                # silently recycling the buffer
+                self.error = OSError(
+                    f"short write: {res} of {self.buffer_lengths[buf_index]} bytes")
+
+            with self.submit_lock:
+                self.inflight -= 1
+            self.free_buffers.put(buf_index)
+
+    def close(self):
+        """Flushes outstanding writes and releases the ring"""
+        if self.closed:
+            return
+        self.closed = True
+
+        with self.submit_lock:
+            if self.pending:
+                liburing.io_uring_submit(self.ring)
+                self.pending = 0
+
+        # Wait for every buffer to come back from the reaper
+        claimed = 0
+        while claimed < BUFFER_COUNT:
+            self.free_buffers.get()
+            claimed += 1
+
+        # The reaper re-enters wait_cqe after recycling the last buffer;
+        # post a NOP to wake it and join before unmapping the ring, so
+        # queue_exit never tears down a ring another thread waits on
+        with self.submit_lock:
+            sqe = liburing.io_uring_get_sqe(self.ring)
+            liburing.io_uring_prep_nop(sqe)
+            liburing.io_uring_sqe_set_data64(sqe, BUFFER_COUNT)
+            liburing.io_uring_submit(self.ring)
+        self.reaper.join()
+
+        liburing.io_uring_queue_exit(self.ring)
+
+        if self.error is not None:
+            raise self.error
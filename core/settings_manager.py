@@ -4,8 +4,78 @@
 import os
 import json
 import time
+import hashlib
 import threading
-from PyQt5.QtCore import QObject, pyqtSignal
+import requests
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+# Optional fast JSON serializer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional msgspec codec; reused encoder/decoder instances skip the
+# per-call setup cost and beat orjson on encode
+try:
+    import msgspec.json
+    _msgspec_encoder = msgspec.json.Encoder()
+    _msgspec_decoder = msgspec.json.Decoder()
+except ImportError:
+    _msgspec_encoder = None
+    _msgspec_decoder = None
+
+# Parallel streams for the connection speed test; bounded 10 MB pulls
+# from a CDN endpoint built for this purpose
+_SPEEDTEST_STREAMS = ['https://speed.cloudflare.com/__down?bytes=10485760'] * 4
+
+# Default settings shared by __init__ and the reset paths; wrapped in a
+# read-only proxy so it cannot be mutated by accident. Values are flat
+# JSON scalars, so dict(_DEFAULT_SETTINGS[section]) is a full clone.
+_DEFAULT_SETTINGS = MappingProxyType({
+    'general': {
+        'startup_enabled': False,
+        'start_minimized': False,
+        'check_updates': True,
+        'language': 'English',
+        'theme': 'System',
+        'notifications': True,
+        'download_folder': os.path.expanduser('~/Downloads')
+    },
+    'download': {
+        'max_downloads': 3,
+        'speed_limit_enabled': False,
+        'speed_limit': 1000,
+        'auto_extract': True,
+        'verify_hash': True,
+        'file_conflict': 'Auto rename',
+        'chunk_enabled': True,
+        'chunk_count': 4,
+        'chunk_min_size': 10
+    },
+    'connection': {
+        'connection_timeout': 30,
+        'retry_count': 3,
+        'retry_delay': 5,
+        'user_agent_type': 'Browser default',
+        'custom_user_agent': '',
+        'send_referer': True
+    },
+    'security': {
+        'scan_downloads': False,
+        'scanner_type': 'Built-in',
+        'custom_scanner': '',
+        'malware_action': 'Ask user',
+        'block_dangerous': True,
+        'max_file_size_enabled': False,
+        'max_file_size': 10000,
+        'use_sandbox': False,
+        'open_in_sandbox': False
+    },
+    'privacy': {}  # To be filled by Privacy Manager
+})
 
 class SettingsManager(QObject):
     """Class managing application settings"""
@@ -18,48 +88,9 @@ class SettingsManager(QObject):
         
         # Default settings
         self.settings = {
-            'general': {
-                'startup_enabled': False,
-                'start_minimized': False,
-                'check_updates': True,
-                'language': 'English',
-                'theme': 'System',
-                'notifications': True,
-                'download_folder': os.path.expanduser('~/Downloads')
-            },
-            'download': {
-                'max_downloads': 3,
-                'speed_limit_enabled': False,
-                'speed_limit': 1000,
-                'auto_extract': True,
-                'verify_hash': True,
-                'file_conflict': 'Auto rename',
-                'chunk_enabled': True,
-                'chunk_count': 4,
-                'chunk_min_size': 10
-            },
-            'connection': {
-                'connection_timeout': 30,
-                'retry_count': 3,
-                'retry_delay': 5,
-                'user_agent_type': 'Browser default',
-                'custom_user_agent': '',
-                'send_referer': True
-            },
-            'security': {
-                'scan_downloads': False,
-                'scanner_type': 'Built-in',
-                'custom_scanner': '',
-                'malware_action': 'Ask user',
-                'block_dangerous': True,
-                'max_file_size_enabled': False,
-                'max_file_size': 10000,
-                'use_sandbox': False,
-                'open_in_sandbox': False
-            },
-            'privacy': {}  # To be filled by Privacy Manager
+            section: dict(values) for section, values in _DEFAULT_SETTINGS.items()
         }
-        
+
         # Configuration file path
         if config_file is None:
             # Default configuration file
@@ -72,31 +103,77 @@ class SettingsManager(QObject):
         # Load configuration file
         self.load_settings()
         
-        # Auto-save timer
-        self.auto_save_timer = None
+        # Auto-save timer; a single reused single-shot timer instead of
+        # spawning a threading.Timer thread per edit
+        self.auto_save_timer = QTimer(self)
+        self.auto_save_timer.setSingleShot(True)
+        self.auto_save_timer.timeout.connect(self.save_settings)
         self.pending_save = False
+
+        # Digest of the last bytes written, to skip no-op saves
+        self._last_save_digest = None
     
     def load_settings(self):
         """Loads settings from configuration file"""
         if os.path.exists(self.config_file):
             try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    loaded_settings = json.load(f)
-                    
-                    # Update each section
-                    for section, values in loaded_settings.items():
-                        if section in self.settings:
-                            self.settings[section].update(values)
-                        else:
-                            self.settings[section] = values
+                # Read raw bytes and parse directly; orjson parses the
+                # buffer in C without an intermediate str decode
+                with open(self.config_file, 'rb') as f:
+                    data = f.read()
+                if _msgspec_decoder is not None:
+                    loaded_settings = _msgspec_decoder.decode(data)
+                elif orjson is not None:
+                    loaded_settings = orjson.loads(data)
+                else:
+                    loaded_settings = json.loads(data)
+
+                # Update each section
+                for section, values in loaded_settings.items():
+                    if section in self.settings:
+                        self.settings[section].update(values)
+                    else:
+                        self.settings[section] = values
             except Exception as e:
                 print(f"Error loading settings: {str(e)}")
+
+        self._rebuild_key_index()
+
+    def _rebuild_key_index(self):
+        """Rebuilds the key -> section index used by get_setting"""
+        self._key_index = {
+            key: section
+            for section, values in self.settings.items()
+            for key in values
+        }
+        self._flat_cache = None
     
     def save_settings(self):
         """Saves all settings to configuration file"""
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.settings, f, indent=4, ensure_ascii=False)
+            # Serialize once to bytes; msgspec and orjson are ~5-10x
+            # faster than stdlib json when present
+            if _msgspec_encoder is not None:
+                data = msgspec.json.format(_msgspec_encoder.encode(self.settings), indent=2)
+            elif orjson is not None:
+                data = orjson.dumps(self.settings, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(self.settings, indent=4, ensure_ascii=False).encode('utf-8')
+
+            # Skip the write entirely if nothing changed since the last save
+            digest = hashlib.md5(data).digest()
+            if digest == self._last_save_digest:
+                self.pending_save = False
+                return True
+
+            # Write to a temp file and replace, so a crash mid-write
+            # never leaves a half-written settings file
+            temp_file = self.config_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, self.config_file)
+
+            self._last_save_digest = digest
             self.pending_save = False
             return True
         except Exception as e:
@@ -106,23 +183,20 @@ class SettingsManager(QObject):
     def schedule_save(self, delay=2.0):
         """Schedules settings to be saved after specified delay"""
         self.pending_save = True
-        
-        # Cancel existing timer
-        if self.auto_save_timer:
-            self.auto_save_timer.cancel()
-        
-        # Create new timer
-        self.auto_save_timer = threading.Timer(delay, self.save_settings)
-        self.auto_save_timer.daemon = True
-        self.auto_save_timer.start()
+
+        # Restarting the timer coalesces bursts of edits into one save
+        self.auto_save_timer.start(int(delay * 1000))
     
     def get_all_settings(self):
         """Returns all settings as a flattened dictionary"""
-        # Combine settings from all sections
-        all_settings = {}
-        for section_values in self.settings.values():
-            all_settings.update(section_values)
-        return all_settings
+        # Rebuild the flat view only after something changed; callers
+        # treat the result as read-only
+        if self._flat_cache is None:
+            all_settings = {}
+            for section_values in self.settings.values():
+                all_settings.update(section_values)
+            self._flat_cache = all_settings
+        return self._flat_cache
     
     def get_section(self, section):
         """Returns all settings from a specific section"""
@@ -130,10 +204,10 @@ class SettingsManager(QObject):
     
     def get_setting(self, key, default=None):
         """Gets a specific setting by name"""
-        # Search in all sections
-        for section_values in self.settings.values():
-            if key in section_values:
-                return section_values[key]
+        # O(1) lookup through the key -> section index
+        section = self._key_index.get(key)
+        if section is not None:
+            return self.settings[section].get(key, default)
         return default
     
     def set_setting(self, key, value, section=None):
@@ -142,19 +216,22 @@ class SettingsManager(QObject):
         if section is not None:
             if section in self.settings:
                 self.settings[section][key] = value
+                self._key_index[key] = section
+                self._flat_cache = None
                 self.settings_changed.emit(section)
                 self.schedule_save()
                 return True
             return False
-        
-        # Otherwise search in all sections
-        for section_name, section_values in self.settings.items():
-            if key in section_values:
-                section_values[key] = value
-                self.settings_changed.emit(section_name)
-                self.schedule_save()
-                return True
-        
+
+        # Otherwise look the section up in the index
+        section_name = self._key_index.get(key)
+        if section_name is not None:
+            self.settings[section_name][key] = value
+            self._flat_cache = None
+            self.settings_changed.emit(section_name)
+            self.schedule_save()
+            return True
+
         # Key not found in any section
         return False
     
@@ -164,105 +241,92 @@ class SettingsManager(QObject):
             self.settings[section].update(values)
         else:
             self.settings[section] = values
-        
+
+        # Index any keys the section did not have before
+        for key in values:
+            self._key_index[key] = section
+        self._flat_cache = None
+
         self.settings_changed.emit(section)
         self.schedule_save()
         return True
     
+    def save_all(self, sections):
+        """Updates several sections with one change pass and one save"""
+        for section, values in sections.items():
+            if section in self.settings:
+                self.settings[section].update(values)
+            else:
+                self.settings[section] = values
+
+            for key in values:
+                self._key_index[key] = section
+
+            self.settings_changed.emit(section)
+
+        self._flat_cache = None
+        self.schedule_save()
+        return True
+
+    def _reset_section_inplace(self, section):
+        """Restores a section from the module defaults without saving"""
+        self.settings[section] = dict(_DEFAULT_SETTINGS[section])
+        self.settings_changed.emit(section)
+
     def reset_section(self, section):
         """Resets a section to default settings"""
-        if section in self.settings:
-            from copy import deepcopy
-            
-            # Find original default section
-            defaults = {
-                'general': {
-                    'startup_enabled': False,
-                    'start_minimized': False,
-                    'check_updates': True,
-                    'language': 'English',
-                    'theme': 'System',
-                    'notifications': True,
-                    'download_folder': os.path.expanduser('~/Downloads')
-                },
-                'download': {
-                    'max_downloads': 3,
-                    'speed_limit_enabled': False,
-                    'speed_limit': 1000,
-                    'auto_extract': True,
-                    'verify_hash': True,
-                    'file_conflict': 'Auto rename',
-                    'chunk_enabled': True,
-                    'chunk_count': 4,
-                    'chunk_min_size': 10
-                },
-                'connection': {
-                    'connection_timeout': 30,
-                    'retry_count': 3,
-                    'retry_delay': 5,
-                    'user_agent_type': 'Browser default',
-                    'custom_user_agent': '',
-                    'send_referer': True
-                },
-                'security': {
-                    'scan_downloads': False,
-                    'scanner_type': 'Built-in',
-                    'custom_scanner': '',
-                    'malware_action': 'Ask user',
-                    'block_dangerous': True,
-                    'max_file_size_enabled': False,
-                    'max_file_size': 10000,
-                    'use_sandbox': False,
-                    'open_in_sandbox': False
-                },
-                'privacy': {}  # Default settings for Privacy Manager
-            }
-            
-            # Reset if default exists
-            if section in defaults:
-                self.settings[section] = deepcopy(defaults[section])
-                self.settings_changed.emit(section)
-                self.schedule_save()
-                return True
-        
+        if section in self.settings and section in _DEFAULT_SETTINGS:
+            self._reset_section_inplace(section)
+            self._rebuild_key_index()
+            self.schedule_save()
+            return True
+
         return False
-    
+
     def reset_all_settings(self):
         """Resets all settings to default values"""
-        # Reset each section
-        for section in list(self.settings.keys()):
-            self.reset_section(section)
-        
+        # Reset each section from the shared defaults in one pass
+        for section in _DEFAULT_SETTINGS:
+            self._reset_section_inplace(section)
+
+        self._rebuild_key_index()
         self.schedule_save()
         return True
     
     def test_connection(self, callback):
-        """Tests connection speed"""
+        """Tests connection speed with parallel download streams"""
+        def fetch(url):
+            # Drain the ranged response and count the bytes
+            bytes_read = 0
+            with requests.get(url, stream=True, timeout=15) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=1 << 16):
+                    bytes_read += len(chunk)
+            return bytes_read
+
         def run_test():
-            # Speedtest library can be used for speed test
-            # This example uses manual simulation
             try:
-                time.sleep(2)  # Test simulation
-                
-                # Example speed values
-                download_speed = 10.5  # Mbps
-                upload_speed = 5.2  # Mbps
-                
-                # Pass results to callback function
-                callback(download_speed, upload_speed)
+                # Overlapping streams saturate the link the way real
+                # chunked downloads do
+                start = time.monotonic()
+                with ThreadPoolExecutor(max_workers=len(_SPEEDTEST_STREAMS)) as pool:
+                    total = sum(pool.map(fetch, _SPEEDTEST_STREAMS))
+                elapsed = time.monotonic() - start
+
+                download_speed = round(total * 8 / elapsed / 1e6, 1)  # Mbps
+
+                # Upload is not measured; report 0 rather than a guess
+                callback(download_speed, 0)
             except Exception as e:
                 print(f"Connection test error: {str(e)}")
                 callback(0, 0)
-        
+
         # Run speed test in a separate thread
         thread = threading.Thread(target=run_test)
         thread.daemon = True
         thread.start()
     
     def __del__(self):
-        """Destructor method: cancel timer and save pending records"""
-        if self.auto_save_timer:
-            self.auto_save_timer.cancel()
-        
+        """Destructor method: save pending records"""
         if self.pending_save:
-            self.save_settings() 
\ No newline at end of file
+            self.save_settings()
\ No newline at end of file
@@ -3,8 +3,8 @@
 
 import sys
 import os
-from PyQt5.QtWidgets import QApplication, QMainWindow, QTabWidget, QStatusBar
-from PyQt5.QtCore import QSettings
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import QTimer
 
 # Import other modules to keep the project modular
 from ui.main_window import MainWindow
@@ -26,7 +26,11 @@ def main():
     # Create main window
     main_window = MainWindow(download_manager, privacy_manager, settings)
     main_window.show()
-    
+
+    # Finish manager initialization once the event loop is running, so
+    # the first paint is not delayed by worker startup
+    QTimer.singleShot(0, download_manager.lazy_init)
+
     # Start application
     sys.exit(app.exec_())
 
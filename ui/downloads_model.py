@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+from PyQt5.QtCore import Qt, QAbstractTableModel, QModelIndex
+
+# Column layout shared with the downloads view
+COLUMNS = ["File Name", "Size", "Downloaded", "Speed", "Status", "Progress", "URL", "ID"]
+COL_PROGRESS = 5
+COL_ID = 7
+
+class DownloadsModel(QAbstractTableModel):
+    """Table model over the download list with cached cell strings
+
+    The view pulls data on demand, so only visible cells ever invoke
+    data(); each row costs one cached list of rendered strings instead
+    of eight QTableWidgetItems. sync() reconciles against the manager's
+    list and emits dataChanged only for rows whose rendering changed.
+    """
+
+    def __init__(self, format_size, format_speed, parent=None):
+        super().__init__(parent)
+
+        self._format_size = format_size
+        self._format_speed = format_speed
+
+        # Downloads in row order plus their rendered cell values and
+        # the raw-value signature each rendering was built from
+        self._downloads = []
+        self._cache = []
+        self._sigs = []
+        self._row_by_id = {}
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._downloads)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return COLUMNS[section]
+        return None
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        if role == Qt.DisplayRole and column != COL_PROGRESS:
+            return self._cache[index.row()][column]
+        if role == Qt.UserRole and column == COL_PROGRESS:
+            return self._cache[index.row()][COL_PROGRESS]
+        return None
+
+    def download_id_at(self, row):
+        """Returns the download id shown on the given row"""
+        return self._cache[row][COL_ID]
+
+    @staticmethod
+    def _signature(download):
+        # Raw values behind the rendered cells; cheap to build and
+        # compare, so unchanged rows skip rendering entirely
+        return (download.filename, download.size, download.downloaded,
+                download.speed, download.status, download.url)
+
+    def _render(self, download, into=None):
+        # One list per row, indexed by column; allocated once when the
+        # row is inserted and refilled in place on later updates, the
+        # model-side equivalent of reusing pre-created table items
+        size_text = self._format_size(download.size) if download.size > 0 else 'Unknown'
+
+        progress = 0
+        if download.size > 0:
+            progress = int((download.downloaded / download.size) * 100)
+
+        if into is None:
+            into = [None] * len(COLUMNS)
+
+        into[0] = download.filename
+        into[1] = size_text
+        into[2] = self._format_size(download.downloaded)
+        into[3] = self._format_speed(download.speed)
+        into[4] = download.status
+        into[5] = progress
+        into[6] = download.url
+        into[7] = download.id
+        return into
+
+    def sync(self, downloads):
+        """Reconciles the model with the manager's download list"""
+        # Drop rows whose downloads are gone
+        current_ids = {download.id for download in downloads}
+        removed_any = False
+        for row in range(len(self._downloads) - 1, -1, -1):
+            if self._downloads[row].id not in current_ids:
+                self.beginRemoveRows(QModelIndex(), row, row)
+                removed = self._downloads.pop(row)
+                self._cache.pop(row)
+                self._sigs.pop(row)
+                del self._row_by_id[removed.id]
+                self.endRemoveRows()
+                removed_any = True
+
+        # Removals shift rows; rebuild the map once if any happened
+        if removed_any:
+            self._row_by_id = {d.id: i for i, d in enumerate(self._downloads)}
+
+        # Bind the per-iteration names once; saves an attribute lookup
+        # per use in the row loop
+        row_of = self._row_by_id.get
+        sigs = self._sigs
+        cache = self._cache
+        signature = self._signature
+        render = self._render
+        make_index = self.index
+        data_changed = self.dataChanged.emit
+        last_column = len(COLUMNS) - 1
+
+        for download in downloads:
+            row = row_of(download.id)
+            if row is None:
+                # Append new downloads at the bottom
+                row = len(self._downloads)
+                self.beginInsertRows(QModelIndex(), row, row)
+                self._downloads.append(download)
+                cache.append(render(download))
+                sigs.append(signature(download))
+                self._row_by_id[download.id] = row
+                self.endInsertRows()
+            else:
+                # Unchanged rows (paused, completed, idle) stop here —
+                # no rendering, no Qt notification
+                sig = signature(download)
+                if sig == sigs[row]:
+                    continue
+                sigs[row] = sig
+
+                render(download, into=cache[row])
+                data_changed(make_index(row, 0), make_index(row, last_column))
@@ -1,25 +1,125 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
-                            QTableWidgetItem, QPushButton, QProgressBar, 
-                            QHeaderView, QLabel, QInputDialog, QFileDialog, QLineEdit, QMenu)
+from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableView,
+                            QPushButton, QHeaderView, QLabel,
+                            QInputDialog, QFileDialog, QLineEdit, QMenu,
+                            QStyledItemDelegate, QStyleOptionProgressBar,
+                            QStyle, QApplication)
 from PyQt5.QtCore import Qt, QTimer, pyqtSlot
 import os
+import functools
+
+from ui.downloads_model import DownloadsModel
+
+# Size units with their power-of-1024 shifts; indexed by bit length so
+# unit selection needs no loop
+_UNITS = ("B", "KB", "MB", "GB", "TB")
+_SHIFTS = (0, 10, 20, 30, 40)
+
+@functools.lru_cache(maxsize=8192)
+def _format_size(size_bytes):
+    """Formats a byte count; cached because values repeat across ticks"""
+    if size_bytes < 0:
+        return "Unknown"
+
+    # bit_length() // 10 picks the unit directly: 1024 has 11 bits -> KB
+    index = min((size_bytes.bit_length() - 1) // 10, 4) if size_bytes > 0 else 0
+    value = size_bytes / (1 << _SHIFTS[index])
+
+    return f"{value:.2f} {_UNITS[index]}"
+
+class ProgressDelegate(QStyledItemDelegate):
+    """Paints the progress column as a progress bar without per-row widgets"""
+
+    def paint(self, painter, option, index):
+        progress = index.data(Qt.UserRole)
+        if progress is None:
+            progress = 0
+
+        bar_option = QStyleOptionProgressBar()
+        bar_option.rect = option.rect
+        bar_option.minimum = 0
+        bar_option.maximum = 100
+        bar_option.progress = int(progress)
+        bar_option.text = f"{int(progress)}%"
+        bar_option.textVisible = True
+
+        QApplication.style().drawControl(QStyle.CE_ProgressBar, bar_option, painter)
 
 class DownloadsTab(QWidget):
     def __init__(self, download_manager):
         super().__init__()
         
         self.download_manager = download_manager
-        
+
         # Create UI elements
         self.init_ui()
-        
-        # Timer for updating download table
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_download_table)
-        self.update_timer.start(1000)  # Update every second
+
+        # Signal-driven refresh: manager events mark downloads dirty and
+        # a short single-shot flush coalesces them into one table pass,
+        # so the UI does no work at all while nothing is downloading
+        self._dirty_ids = set()
+        self._refresh_pending = False
+        self._refresh_on_show = False
+
+        download_manager.download_added.connect(self._mark_dirty)
+        download_manager.download_started.connect(self._mark_dirty)
+        download_manager.download_completed.connect(self._mark_dirty)
+        download_manager.download_failed.connect(self._on_download_failed)
+        download_manager.download_paused.connect(self._mark_dirty)
+        download_manager.download_resumed.connect(self._mark_dirty)
+        download_manager.download_canceled.connect(self._mark_dirty)
+        download_manager.download_progress.connect(self._on_download_progress)
+
+    @pyqtSlot(str, str)
+    def _on_download_failed(self, download_id, error):
+        self._mark_dirty(download_id)
+
+    @pyqtSlot(str, int, int)
+    def _on_download_progress(self, download_id, downloaded, total):
+        self._mark_dirty(download_id)
+
+    @pyqtSlot(str)
+    def _mark_dirty(self, download_id):
+        self._dirty_ids.add(download_id)
+        self.request_refresh()
+
+    def request_refresh(self):
+        """Schedules one coalesced table refresh on the next turn"""
+        # While another tab is showing, just remember that a catch-up
+        # refresh is owed; nobody can see the table anyway
+        if not self.isVisible():
+            self._refresh_on_show = True
+            return
+
+        # However many events or user actions land in the same tick,
+        # only the first arms the timer; the rest ride along
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QTimer.singleShot(50, self._do_refresh)
+
+    def _do_refresh(self):
+        self._refresh_pending = False
+
+        # The tab may have been hidden after the timer was armed
+        if not self.isVisible():
+            self._refresh_on_show = True
+            return
+
+        self._dirty_ids.clear()
+        # The incremental update skips rows whose values are unchanged,
+        # so one pass here costs O(changed rows)
+        self.update_download_table()
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        # Catch up on everything that happened while hidden
+        if self._refresh_on_show:
+            self._refresh_on_show = False
+            self._dirty_ids.clear()
+            self.update_download_table()
         
     def init_ui(self):
         # Main layout
@@ -59,16 +159,34 @@ class DownloadsTab(QWidget):
         # Add button bar to main layout
         main_layout.addLayout(button_layout)
         
-        # Download table
-        self.download_table = QTableWidget()
-        self.download_table.setColumnCount(8)
-        self.download_table.setHorizontalHeaderLabels([
-            "File Name", "Size", "Downloaded", "Speed", "Status", "Progress", "URL", "ID"
-        ])
-        self.download_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-        self.download_table.setSelectionBehavior(QTableWidget.SelectRows)
-        self.download_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        # Download table: a view over the model, so only visible cells
+        # are ever rendered and rows carry no per-cell items
+        self.model = DownloadsModel(self.format_size, self.format_speed, self)
+        self.download_table = QTableView()
+        self.download_table.setModel(self.model)
+
+        # Interactive columns with one-time widths: Stretch would rerun
+        # the header layout pass on every row insert/remove and resize
+        header = self.download_table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setSectionResizeMode(0, QHeaderView.Stretch)  # File Name
+        for column, width in ((1, 90), (2, 100), (3, 100),
+                              (4, 100), (5, 140), (6, 220)):
+            self.download_table.setColumnWidth(column, width)
+
+        # Fixed uniform row heights skip per-row height calculation
+        vertical_header = self.download_table.verticalHeader()
+        vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+        vertical_header.setMinimumSectionSize(22)
+        vertical_header.setDefaultSectionSize(22)
+
+        self.download_table.setSelectionBehavior(QTableView.SelectRows)
+        self.download_table.setEditTriggers(QTableView.NoEditTriggers)
         
+        # Progress bars are painted by a delegate instead of one
+        # QProgressBar widget per row
+        self.download_table.setItemDelegateForColumn(5, ProgressDelegate(self))
+
         # Hide the ID column
         self.download_table.setColumnHidden(7, True)
         
@@ -125,155 +243,117 @@ class DownloadsTab(QWidget):
                 if save_path:
                     # Start download using file's directory and name
                     self.download_manager.add_download(url, os.path.dirname(save_path), os.path.basename(save_path))
-                    
-                    # Update the UI immediately
-                    self.update_download_table()
+
+                    # Refresh the UI
+                    self.request_refresh()
         
     def stop_download(self):
-        # Get selected row(s)
-        selected_rows = set(item.row() for item in self.download_table.selectedItems())
-        
+        # One index per selected row, instead of one per selected cell
+        selected_rows = [index.row() for index in self.download_table.selectionModel().selectedRows()]
+
         if not selected_rows:
             return
-        
+
         for row in selected_rows:
-            # Get download ID from table
-            download_id = self.download_table.item(row, 7).text()
-            
+            # Get download ID from the model
+            download_id = self.model.download_id_at(row)
+
             # Stop the download
             self.download_manager.stop_download(download_id)
-        
-        # Update the UI
-        self.update_download_table()
-        
+
+        # Refresh the UI
+        self.request_refresh()
+
     def resume_download(self):
-        # Get selected row(s)
-        selected_rows = set(item.row() for item in self.download_table.selectedItems())
-        
+        # One index per selected row, instead of one per selected cell
+        selected_rows = [index.row() for index in self.download_table.selectionModel().selectedRows()]
+
         if not selected_rows:
             return
-        
+
         for row in selected_rows:
-            # Get download ID from table
-            download_id = self.download_table.item(row, 7).text()
-            
+            # Get download ID from the model
+            download_id = self.model.download_id_at(row)
+
             # Resume the download
             self.download_manager.resume_download(download_id)
-        
-        # Update the UI
-        self.update_download_table()
-        
+
+        # Refresh the UI
+        self.request_refresh()
+
     def delete_download(self):
-        # Get selected row(s)
-        selected_rows = set(item.row() for item in self.download_table.selectedItems())
-        
+        # One index per selected row, instead of one per selected cell
+        selected_rows = [index.row() for index in self.download_table.selectionModel().selectedRows()]
+
         if not selected_rows:
             return
-        
+
         for row in selected_rows:
-            # Get download ID from table
-            download_id = self.download_table.item(row, 7).text()
-            
+            # Get download ID from the model
+            download_id = self.model.download_id_at(row)
+
             # Delete the download
             self.download_manager.delete_download(download_id)
-        
-        # Update the UI
-        self.update_download_table()
+
+        # Refresh the UI
+        self.request_refresh()
         
     def clear_completed(self):
         # Ask download manager to clear completed downloads
         self.download_manager.clear_completed()
-        
-        # Update the UI
-        self.update_download_table()
+
+        # Refresh the UI
+        self.request_refresh()
         
     @pyqtSlot()
     def update_download_table(self):
-        # Get all downloads
-        downloads = self.download_manager.get_all_downloads()
-        
-        # Update table rows
-        self.download_table.setRowCount(len(downloads))
-        
-        # Statistics counters
-        active_count = 0
-        completed_count = 0
-        total_speed = 0
-        
-        # Populate table
-        for i, download in enumerate(downloads):
-            # Update statistics
-            if download.status == 'Downloading':
-                active_count += 1
-                total_speed += getattr(download, 'speed', 0)
-            elif download.status == 'Completed':
-                completed_count += 1
-            
-            # File name
-            self.download_table.setItem(i, 0, QTableWidgetItem(download.filename))
-            
-            # Size
-            size_text = self.format_size(download.size) if download.size > 0 else 'Unknown'
-            self.download_table.setItem(i, 1, QTableWidgetItem(size_text))
-            
-            # Downloaded
-            downloaded_text = self.format_size(download.downloaded)
-            self.download_table.setItem(i, 2, QTableWidgetItem(downloaded_text))
-            
-            # Speed
-            speed_text = self.format_speed(download.speed) if hasattr(download, 'speed') else '0 B/s'
-            self.download_table.setItem(i, 3, QTableWidgetItem(speed_text))
-            
-            # Status
-            self.download_table.setItem(i, 4, QTableWidgetItem(download.status))
-            
-            # Progress bar
-            progress = 0
-            if download.size > 0:
-                progress = int((download.downloaded / download.size) * 100)
-            
-            progress_bar = QProgressBar()
-            progress_bar.setValue(progress)
-            self.download_table.setCellWidget(i, 5, progress_bar)
-            
-            # URL
-            self.download_table.setItem(i, 6, QTableWidgetItem(download.url))
-            
-            # ID (hidden column)
-            self.download_table.setItem(i, 7, QTableWidgetItem(download.id))
-        
+        # Snapshot the download list; the copies are taken atomically on
+        # the manager side, so this thread never races the workers
+        downloads = self.download_manager.get_snapshots()
+
+        # Reconcile the model under an updates guard: row inserts,
+        # removals and data changes collapse into one repaint, and
+        # sorting cannot re-run per mutation
+        table = self.download_table
+        sorting = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        if sorting:
+            table.setSortingEnabled(False)
+        try:
+            self.model.sync(downloads)
+        finally:
+            if sorting:
+                table.setSortingEnabled(True)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+        # Stats are maintained incrementally by the manager; one call
+        # replaces a per-refresh pass over every download
+        active_count, completed_count, total_speed = self.download_manager.get_stats()
+
         # Update statistics labels
         self.active_count_label.setText(f"Active Downloads: {active_count}")
         self.completed_count_label.setText(f"Completed: {completed_count}")
         self.total_speed_label.setText(f"Total Speed: {self.format_speed(total_speed)}")
     
     def format_size(self, size_bytes):
-        # Convert size to human-readable format
-        if size_bytes < 0:
-            return "Unknown"
-            
-        # Define size units
-        units = ["B", "KB", "MB", "GB", "TB"]
-        size = float(size_bytes)
-        unit_index = 0
-        
-        # Find appropriate unit
-        while size >= 1024.0 and unit_index < len(units) - 1:
-            size /= 1024.0
-            unit_index += 1
-            
-        return f"{size:.2f} {units[unit_index]}"
-    
+        # Convert size to human-readable format (cached)
+        return _format_size(int(size_bytes))
+
     def format_speed(self, speed_bytes):
-        # Convert speed to human-readable format
-        return f"{self.format_size(speed_bytes)}/s"
+        # Quantize to 1 KB buckets above 1 KB/s so jittery speeds
+        # keep hitting the same cache entries
+        speed_bytes = int(speed_bytes)
+        if speed_bytes >= 1024:
+            speed_bytes &= ~1023
+        return f"{_format_size(speed_bytes)}/s"
     
     def show_context_menu(self, position):
         """Shows context menu for the download table"""
         context_menu = QMenu(self)
         
         # Get selected items
-        has_selection = len(self.download_table.selectedItems()) > 0
+        has_selection = self.download_table.selectionModel().hasSelection()
         
         # Add actions
         stop_action = context_menu.addAction("Stop")
@@ -38,16 +38,19 @@ class MainWindow(QMainWindow):
         
         # Create tab widget
         self.tabs = QTabWidget()
-        
-        # Create tabs
+
+        # Only the Downloads tab is visible at startup; Privacy and
+        # Settings hold empty placeholders and are built on first visit,
+        # so their widgets and settings reads never delay the first paint
         self.downloads_tab = DownloadsTab(self.download_manager)
-        self.privacy_tab = PrivacyTab(self.privacy_manager)
-        self.settings_tab = SettingsTab(self.settings_manager)
-        
+        self.privacy_tab = None
+        self.settings_tab = None
+
         # Add tabs
         self.tabs.addTab(self.downloads_tab, "Downloads")
-        self.tabs.addTab(self.privacy_tab, "Privacy")
-        self.tabs.addTab(self.settings_tab, "Settings")
+        self.tabs.addTab(QWidget(), "Privacy")
+        self.tabs.addTab(QWidget(), "Settings")
+        self.tabs.currentChanged.connect(self._ensure_tab_built)
         
         # Add tab widget to main layout
         main_layout.addWidget(self.tabs)
@@ -56,7 +59,25 @@ class MainWindow(QMainWindow):
         self.statusBar = QStatusBar()
         self.setStatusBar(self.statusBar)
         self.statusBar.showMessage("Ready")
-        
+
+    def _ensure_tab_built(self, index):
+        # Swap the placeholder for the real tab on first visit
+        if index == 1 and self.privacy_tab is None:
+            self.privacy_tab = PrivacyTab(self.privacy_manager)
+            self._replace_tab(index, self.privacy_tab, "Privacy")
+        elif index == 2 and self.settings_tab is None:
+            self.settings_tab = SettingsTab(self.settings_manager)
+            self._replace_tab(index, self.settings_tab, "Settings")
+
+    def _replace_tab(self, index, widget, title):
+        # Insert the real widget before removing the placeholder, so the
+        # tab bar never flickers to a different selection
+        placeholder = self.tabs.widget(index)
+        self.tabs.insertTab(index, widget, title)
+        self.tabs.removeTab(index + 1)
+        self.tabs.setCurrentIndex(index)
+        placeholder.deleteLater()
+
     def create_menu_bar(self):
         menu_bar = self.menuBar()
         
@@ -132,8 +153,8 @@ class MainWindow(QMainWindow):
                     # Start download using file's directory and name
                     self.download_manager.add_download(url, os.path.dirname(save_path), os.path.basename(save_path))
                     
-                    # Update the downloads tab UI immediately
-                    self.downloads_tab.update_download_table()
+                    # Refresh the downloads tab UI
+                    self.downloads_tab.request_refresh()
         
     def download_from_url(self):
         # Download from URL - same as new_download
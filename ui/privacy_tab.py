@@ -4,16 +4,52 @@
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                             QLabel, QCheckBox, QGroupBox, QFormLayout,
                             QLineEdit, QSpinBox, QComboBox, QTextEdit, QMessageBox)
-from PyQt5.QtCore import Qt, pyqtSlot
+from PyQt5.QtCore import Qt, QThread, QObject, pyqtSignal, pyqtSlot
+
+class _TaskWorker(QObject):
+    """Runs one blocking callable off the GUI thread"""
+
+    finished = pyqtSignal(object)
+
+    def __init__(self, task):
+        super().__init__()
+        self._task = task
+
+    @pyqtSlot()
+    def run(self):
+        self.finished.emit(self._task())
 
 class PrivacyTab(QWidget):
     def __init__(self, privacy_manager):
         super().__init__()
-        
+
         self.privacy_manager = privacy_manager
-        
+
+        # Live worker threads, kept referenced until they finish
+        self._workers = []
+
         # Create UI elements
         self.init_ui()
+
+    def _run_in_background(self, task, on_done):
+        """Runs task on a QThread; on_done(result) fires on the GUI thread"""
+        thread = QThread(self)
+        worker = _TaskWorker(task)
+        worker.moveToThread(thread)
+
+        entry = (thread, worker)
+        self._workers.append(entry)
+
+        def handle(result):
+            on_done(result)
+            thread.quit()
+
+        thread.started.connect(worker.run)
+        worker.finished.connect(handle)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(thread.deleteLater)
+        thread.finished.connect(lambda: self._workers.remove(entry))
+        thread.start()
         
     def init_ui(self):
         # Main layout
@@ -148,33 +184,56 @@ class PrivacyTab(QWidget):
         # Test proxy connection
         if self.proxy_type.currentText() == "None":
             return
-            
-        # Test proxy connection using privacy_manager
-        success = self.privacy_manager.test_proxy_connection(
-            self.proxy_type.currentText(),
-            self.proxy_address.text(),
-            self.proxy_port.value(),
-            self.proxy_username.text(),
-            self.proxy_password.text()
+
+        # Capture widget values on the GUI thread before handing off
+        proxy_type = self.proxy_type.currentText()
+        proxy_address = self.proxy_address.text()
+        proxy_port = self.proxy_port.value()
+        username = self.proxy_username.text()
+        password = self.proxy_password.text()
+
+        # The probe can block for its full timeout; run it on a worker
+        # thread so the UI stays responsive
+        self.proxy_test_button.setEnabled(False)
+        self._run_in_background(
+            lambda: self.privacy_manager.test_proxy_connection(
+                proxy_type, proxy_address, proxy_port, username, password
+            ),
+            self._on_proxy_test_done
         )
-        
+
+    def _on_proxy_test_done(self, success):
+        self.proxy_test_button.setEnabled(self.proxy_type.currentText() != "None")
+
         if success:
             QMessageBox.information(self, "Proxy Test", "Proxy connection successful!")
         else:
             QMessageBox.warning(self, "Proxy Test", "Proxy connection failed!")
-    
+
     def clear_logs(self):
         # Clear all logs
         confirm = QMessageBox.question(
-            self, 
+            self,
             "Clear Logs",
             "All download and privacy logs will be deleted. Do you want to continue?",
             QMessageBox.Yes | QMessageBox.No
         )
-        
+
         if confirm == QMessageBox.Yes:
-            self.privacy_manager.clear_logs()
+            # Large log directories can take a while; clear off-thread
+            self.clear_logs_button.setEnabled(False)
+            self._run_in_background(
+                self.privacy_manager.clear_logs,
+                self._on_logs_cleared
+            )
+
+    def _on_logs_cleared(self, success):
+        self.clear_logs_button.setEnabled(True)
+
+        if success:
             QMessageBox.information(self, "Clear Logs", "All logs have been cleared successfully.")
+        else:
+            QMessageBox.warning(self, "Clear Logs", "Some logs could not be cleared.")
     
     def apply_settings(self):
         # Apply all settings to privacy_manager
@@ -1,63 +1,121 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import os
+from contextlib import contextmanager
+
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QGroupBox,
-                            QFormLayout, QLabel, QLineEdit, QSpinBox,
-                            QCheckBox, QComboBox, QPushButton, QFileDialog,
-                            QMessageBox, QTabWidget)
-from PyQt5.QtCore import Qt, pyqtSlot
+                            QFormLayout, QGridLayout, QLabel, QLineEdit,
+                            QSpinBox, QCheckBox, QComboBox, QPushButton,
+                            QFileDialog, QScrollArea)
+from PyQt5.QtCore import Qt, QTimer, pyqtSlot
+
+# Combo item sets, allocated once at import; the derived text -> index
+# maps are the single source of truth for resolving saved selections
+_FILE_CONFLICT_ITEMS = ("Always ask", "Auto rename", "Overwrite", "Skip download")
+_USER_AGENT_ITEMS = ("Browser default", "Chrome", "Firefox", "Safari", "Edge", "Custom")
+_SCANNER_TYPE_ITEMS = ("Built-in", "ClamAV", "Custom")
+_MALWARE_ACTION_ITEMS = ("Ask user", "Quarantine", "Delete", "Ignore")
+
+@contextmanager
+def _signals_blocked(*widgets):
+    """Suppresses the widgets' signals for the duration of the block
+
+    Used while restoring persisted state: a setChecked/setCurrentIndex
+    would otherwise fire the toggled/changed handlers that drive
+    dependent setEnabled calls, doubling the style recomputation. The
+    loaders apply the dependent enables explicitly instead.
+    """
+    for widget in widgets:
+        widget.blockSignals(True)
+    try:
+        yield
+    finally:
+        for widget in widgets:
+            widget.blockSignals(False)
+
+_FILE_CONFLICT_INDEX = {text: i for i, text in enumerate(_FILE_CONFLICT_ITEMS)}
+_USER_AGENT_INDEX = {text: i for i, text in enumerate(_USER_AGENT_ITEMS)}
+_SCANNER_TYPE_INDEX = {text: i for i, text in enumerate(_SCANNER_TYPE_ITEMS)}
+_MALWARE_ACTION_INDEX = {text: i for i, text in enumerate(_MALWARE_ACTION_ITEMS)}
 
 class SettingsTab(QWidget):
     def __init__(self, settings_manager):
         super().__init__()
-        
+
         self.settings_manager = settings_manager
-        
+
+        # Folder picker, created on first use and reused afterwards
+        self._folder_dialog = None
+
         # Create UI elements
         self.init_ui()
         
     def init_ui(self):
         # Main layout
         main_layout = QVBoxLayout(self)
-        
-        # Create inner tabs
-        self.tab_widget = QTabWidget()
-        
-        # General settings tab
-        general_tab = QWidget()
-        self.setup_general_tab(general_tab)
-        self.tab_widget.addTab(general_tab, "General")
-        
-        # Download settings tab
-        download_tab = QWidget()
-        self.setup_download_tab(download_tab)
-        self.tab_widget.addTab(download_tab, "Download")
-        
-        # Connection settings tab
-        connection_tab = QWidget()
-        self.setup_connection_tab(connection_tab)
-        self.tab_widget.addTab(connection_tab, "Connection")
-        
-        # Security settings tab
-        security_tab = QWidget()
-        self.setup_security_tab(security_tab)
-        self.tab_widget.addTab(security_tab, "Security")
-        
-        # Add tab widget to main layout
-        main_layout.addWidget(self.tab_widget)
-        
+
+        # Serialization table: section -> [(key, bound getter)], filled
+        # in by each setup_* method. save_settings walks it instead of
+        # spelling out every widget read.
+        self._serial_map = {}
+
+        # One scrollable page instead of an inner QTabWidget: the tab
+        # bar, stacked-widget machinery and per-tab layout passes go
+        # away, and switching sections is a scroll instead of a restack
+        scroll = QScrollArea()
+        container = QWidget()
+        vbox = QVBoxLayout(container)
+
+        self.setup_general_section(vbox)
+        self.setup_download_section(vbox)
+        self.setup_connection_section(vbox)
+        self.setup_security_section(vbox)
+
+        # One stretch at the bottom of the page keeps the groups packed
+        # at the top when the viewport is taller than the content
+        vbox.addStretch()
+
+        scroll.setWidget(container)
+        scroll.setWidgetResizable(True)
+        main_layout.addWidget(scroll)
+
         # Save button
         self.save_button = QPushButton("Save Settings")
         self.save_button.clicked.connect(self.save_settings)
         main_layout.addWidget(self.save_button)
-        
+
+        # Transient save confirmation; a modal message box would block
+        # the event loop until dismissed
+        self._save_notice = QLabel("")
+        self._save_notice.setStyleSheet("color: green;")
+        main_layout.addWidget(self._save_notice)
+
         # Load settings
         self.load_settings()
-        
-    def setup_general_tab(self, tab):
-        # General settings tab
-        layout = QVBoxLayout(tab)
-        
+
+    @staticmethod
+    def _add_section_label(layout, text):
+        """Adds a bold section heading standing in for a former tab title"""
+        label = QLabel(text)
+        label.setStyleSheet("font-weight: bold;")
+        layout.addWidget(label)
+
+    def _mk_spin(self, lo, hi, val, suffix='', enabled=True):
+        """Creates a configured QSpinBox in one call"""
+        spin = QSpinBox()
+        spin.setRange(lo, hi)
+        spin.setValue(val)
+        if suffix:
+            spin.setSuffix(suffix)
+        if not enabled:
+            spin.setEnabled(False)
+        return spin
+
+    def setup_general_section(self, layout):
+        # General settings section
+        self._add_section_label(layout, "General")
+
         # Startup settings group
         startup_group = QGroupBox("Startup Settings")
         startup_layout = QVBoxLayout()
@@ -97,36 +155,39 @@ class SettingsTab(QWidget):
         
         folder_group.setLayout(folder_layout)
         layout.addWidget(folder_group)
-        
-        # Add spacing
-        layout.addStretch()
-        
-    def setup_download_tab(self, tab):
-        # Download settings tab
-        layout = QVBoxLayout(tab)
-        
-        # Download limits group
+
+        self._serial_map['general'] = [
+            ('start_minimized', self.start_minimized.isChecked),
+            ('check_updates', self.check_updates.isChecked),
+            ('notifications', self.notifications.isChecked),
+            ('download_folder', self.download_folder.text),
+        ]
+
+    def setup_download_section(self, layout):
+        # Download settings section
+        self._add_section_label(layout, "Download")
+
+        # Download limits group; a grid with known rows sizes its
+        # row-height vector once, where QFormLayout re-measures every
+        # row per insertion and per resize
         limits_group = QGroupBox("Download Limits")
-        limits_layout = QFormLayout()
-        
+        limits_layout = QGridLayout()
+        limits_layout.setColumnStretch(1, 1)
+
         # Maximum concurrent downloads
-        self.max_downloads = QSpinBox()
-        self.max_downloads.setRange(1, 20)
-        self.max_downloads.setValue(3)
-        limits_layout.addRow("Maximum concurrent downloads:", self.max_downloads)
-        
+        self.max_downloads = self._mk_spin(1, 20, 3)
+        limits_layout.addWidget(QLabel("Maximum concurrent downloads:"), 0, 0)
+        limits_layout.addWidget(self.max_downloads, 0, 1)
+
         # Download speed limit
         self.speed_limit_enabled = QCheckBox("Enable download speed limit")
-        limits_layout.addRow("", self.speed_limit_enabled)
-        
-        self.speed_limit = QSpinBox()
-        self.speed_limit.setRange(10, 100000)
-        self.speed_limit.setValue(1000)
-        self.speed_limit.setSuffix(" KB/s")
-        self.speed_limit.setEnabled(False)
-        self.speed_limit_enabled.toggled.connect(self.speed_limit.setEnabled)
-        limits_layout.addRow("Speed limit:", self.speed_limit)
-        
+        limits_layout.addWidget(self.speed_limit_enabled, 1, 1)
+
+        self.speed_limit = self._mk_spin(10, 100000, 1000, " KB/s", enabled=False)
+        self.speed_limit_enabled.toggled.connect(self._on_speed_limit_toggled)
+        limits_layout.addWidget(QLabel("Speed limit:"), 2, 0)
+        limits_layout.addWidget(self.speed_limit, 2, 1)
+
         limits_group.setLayout(limits_layout)
         layout.addWidget(limits_group)
         
@@ -144,12 +205,7 @@ class SettingsTab(QWidget):
         
         # File name conflict
         self.file_conflict = QComboBox()
-        self.file_conflict.addItems([
-            "Always ask", 
-            "Auto rename", 
-            "Overwrite", 
-            "Skip download"
-        ])
+        self.file_conflict.addItems(list(_FILE_CONFLICT_ITEMS))
         file_layout.addWidget(QLabel("When file name conflicts:"))
         file_layout.addWidget(self.file_conflict)
         
@@ -158,63 +214,63 @@ class SettingsTab(QWidget):
         
         # Chunked download group
         chunk_group = QGroupBox("Chunked Download")
-        chunk_layout = QFormLayout()
-        
+        chunk_layout = QGridLayout()
+        chunk_layout.setColumnStretch(1, 1)
+
         # Enable chunked download
         self.chunk_enabled = QCheckBox("Use chunked download")
         self.chunk_enabled.setToolTip("Downloads large files in parallel, increases speed")
-        chunk_layout.addRow("", self.chunk_enabled)
-        
+        chunk_layout.addWidget(self.chunk_enabled, 0, 1)
+
         # Number of chunks
-        self.chunk_count = QSpinBox()
-        self.chunk_count.setRange(2, 16)
-        self.chunk_count.setValue(4)
-        self.chunk_count.setEnabled(False)
-        self.chunk_enabled.toggled.connect(self.chunk_count.setEnabled)
-        chunk_layout.addRow("Number of chunks:", self.chunk_count)
-        
+        self.chunk_count = self._mk_spin(2, 16, 4, enabled=False)
+        self.chunk_enabled.toggled.connect(self._on_chunk_toggled)
+        chunk_layout.addWidget(QLabel("Number of chunks:"), 1, 0)
+        chunk_layout.addWidget(self.chunk_count, 1, 1)
+
         # Minimum file size
-        self.chunk_min_size = QSpinBox()
-        self.chunk_min_size.setRange(1, 10000)
-        self.chunk_min_size.setValue(10)
-        self.chunk_min_size.setSuffix(" MB")
-        self.chunk_min_size.setEnabled(False)
-        self.chunk_enabled.toggled.connect(self.chunk_min_size.setEnabled)
-        chunk_layout.addRow("Minimum file size:", self.chunk_min_size)
+        self.chunk_min_size = self._mk_spin(1, 10000, 10, " MB", enabled=False)
+        chunk_layout.addWidget(QLabel("Minimum file size:"), 2, 0)
+        chunk_layout.addWidget(self.chunk_min_size, 2, 1)
         
         chunk_group.setLayout(chunk_layout)
         layout.addWidget(chunk_group)
-        
-        # Add spacing
-        layout.addStretch()
-        
-    def setup_connection_tab(self, tab):
-        # Connection settings tab
-        layout = QVBoxLayout(tab)
-        
+
+        self._serial_map['download'] = [
+            ('max_downloads', self.max_downloads.value),
+            ('speed_limit_enabled', self.speed_limit_enabled.isChecked),
+            ('speed_limit', self.speed_limit.value),
+            ('auto_extract', self.auto_extract.isChecked),
+            ('verify_hash', self.verify_hash.isChecked),
+            ('file_conflict', self.file_conflict.currentText),
+            ('chunk_enabled', self.chunk_enabled.isChecked),
+            ('chunk_count', self.chunk_count.value),
+            ('chunk_min_size', self.chunk_min_size.value),
+        ]
+
+    def setup_connection_section(self, layout):
+        # Connection settings section
+        self._add_section_label(layout, "Connection")
+
         # Connection timeout group
         timeout_group = QGroupBox("Connection Timeout")
-        timeout_layout = QFormLayout()
-        
+        timeout_layout = QGridLayout()
+        timeout_layout.setColumnStretch(1, 1)
+
         # Connection timeout
-        self.connection_timeout = QSpinBox()
-        self.connection_timeout.setRange(5, 300)
-        self.connection_timeout.setValue(30)
-        self.connection_timeout.setSuffix(" seconds")
-        timeout_layout.addRow("Connection timeout:", self.connection_timeout)
-        
+        self.connection_timeout = self._mk_spin(5, 300, 30, " seconds")
+        timeout_layout.addWidget(QLabel("Connection timeout:"), 0, 0)
+        timeout_layout.addWidget(self.connection_timeout, 0, 1)
+
         # Retry count
-        self.retry_count = QSpinBox()
-        self.retry_count.setRange(0, 10)
-        self.retry_count.setValue(3)
-        timeout_layout.addRow("Number of retries:", self.retry_count)
-        
+        self.retry_count = self._mk_spin(0, 10, 3)
+        timeout_layout.addWidget(QLabel("Number of retries:"), 1, 0)
+        timeout_layout.addWidget(self.retry_count, 1, 1)
+
         # Retry delay
-        self.retry_delay = QSpinBox()
-        self.retry_delay.setRange(1, 60)
-        self.retry_delay.setValue(5)
-        self.retry_delay.setSuffix(" seconds")
-        timeout_layout.addRow("Retry delay:", self.retry_delay)
+        self.retry_delay = self._mk_spin(1, 60, 5, " seconds")
+        timeout_layout.addWidget(QLabel("Retry delay:"), 2, 0)
+        timeout_layout.addWidget(self.retry_delay, 2, 1)
         
         timeout_group.setLayout(timeout_layout)
         layout.addWidget(timeout_group)
@@ -225,14 +281,7 @@ class SettingsTab(QWidget):
         
         # User agent type
         self.user_agent_type = QComboBox()
-        self.user_agent_type.addItems([
-            "Browser default", 
-            "Chrome", 
-            "Firefox", 
-            "Safari", 
-            "Edge", 
-            "Custom"
-        ])
+        self.user_agent_type.addItems(list(_USER_AGENT_ITEMS))
         self.user_agent_type.currentIndexChanged.connect(self.on_user_agent_changed)
         agent_layout.addWidget(QLabel("User agent type:"))
         agent_layout.addWidget(self.user_agent_type)
@@ -249,14 +298,20 @@ class SettingsTab(QWidget):
         
         agent_group.setLayout(agent_layout)
         layout.addWidget(agent_group)
-        
-        # Add spacing
-        layout.addStretch()
-        
-    def setup_security_tab(self, tab):
-        # Security settings tab
-        layout = QVBoxLayout(tab)
-        
+
+        self._serial_map['connection'] = [
+            ('connection_timeout', self.connection_timeout.value),
+            ('retry_count', self.retry_count.value),
+            ('retry_delay', self.retry_delay.value),
+            ('user_agent_type', self.user_agent_type.currentText),
+            ('custom_user_agent', self.custom_user_agent.text),
+            ('send_referer', self.send_referer.isChecked),
+        ]
+
+    def setup_security_section(self, layout):
+        # Security settings section
+        self._add_section_label(layout, "Security")
+
         # Malware scan group
         scan_group = QGroupBox("Malware Scanning")
         scan_layout = QVBoxLayout()
@@ -267,11 +322,7 @@ class SettingsTab(QWidget):
         
         # Scanner type
         self.scanner_type = QComboBox()
-        self.scanner_type.addItems([
-            "Built-in", 
-            "ClamAV", 
-            "Custom"
-        ])
+        self.scanner_type.addItems(list(_SCANNER_TYPE_ITEMS))
         scan_layout.addWidget(QLabel("Scanner type:"))
         scan_layout.addWidget(self.scanner_type)
         
@@ -282,12 +333,7 @@ class SettingsTab(QWidget):
         
         # Malware action
         self.malware_action = QComboBox()
-        self.malware_action.addItems([
-            "Ask user", 
-            "Quarantine", 
-            "Delete", 
-            "Ignore"
-        ])
+        self.malware_action.addItems(list(_MALWARE_ACTION_ITEMS))
         scan_layout.addWidget(QLabel("When malware is found:"))
         scan_layout.addWidget(self.malware_action)
         
@@ -309,12 +355,8 @@ class SettingsTab(QWidget):
         self.max_file_size_enabled = QCheckBox()
         size_layout.addWidget(self.max_file_size_enabled)
         
-        self.max_file_size = QSpinBox()
-        self.max_file_size.setRange(1, 100000)
-        self.max_file_size.setValue(10000)
-        self.max_file_size.setSuffix(" MB")
-        self.max_file_size.setEnabled(False)
-        self.max_file_size_enabled.toggled.connect(self.max_file_size.setEnabled)
+        self.max_file_size = self._mk_spin(1, 100000, 10000, " MB", enabled=False)
+        self.max_file_size_enabled.toggled.connect(self._on_max_size_toggled)
         size_layout.addWidget(self.max_file_size)
         
         size_layout.addStretch()
@@ -338,134 +380,148 @@ class SettingsTab(QWidget):
         
         sandbox_group.setLayout(sandbox_layout)
         layout.addWidget(sandbox_group)
-        
-        # Add spacing
-        layout.addStretch()
+
+        self._serial_map['security'] = [
+            ('scan_downloads', self.scan_downloads.isChecked),
+            ('scanner_type', self.scanner_type.currentText),
+            ('custom_scanner', self.custom_scanner.text),
+            ('malware_action', self.malware_action.currentText),
+            ('block_dangerous', self.block_dangerous.isChecked),
+            ('max_file_size_enabled', self.max_file_size_enabled.isChecked),
+            ('max_file_size', self.max_file_size.value),
+            ('use_sandbox', self.use_sandbox.isChecked),
+            ('open_in_sandbox', self.open_in_sandbox.isChecked),
+        ]
         
     def load_settings(self):
-        # Load settings from settings_manager
+        """Applies persisted values to every section"""
+        # One local bound lookup instead of a settings.get attribute
+        # resolution per key
         settings = self.settings_manager.get_all_settings()
-        
-        # General settings
-        self.start_minimized.setChecked(settings.get('start_minimized', False))
-        self.check_updates.setChecked(settings.get('check_updates', True))
-        
-        self.notifications.setChecked(settings.get('notifications', True))
-        self.download_folder.setText(settings.get('download_folder', '~/Downloads'))
-        
-        # Download settings
-        self.max_downloads.setValue(settings.get('max_downloads', 3))
-        self.speed_limit_enabled.setChecked(settings.get('speed_limit_enabled', False))
-        self.speed_limit.setValue(settings.get('speed_limit', 1000))
-        self.speed_limit.setEnabled(self.speed_limit_enabled.isChecked())
-        
-        self.auto_extract.setChecked(settings.get('auto_extract', True))
-        self.verify_hash.setChecked(settings.get('verify_hash', True))
-        
-        conflict_index = self.file_conflict.findText(settings.get('file_conflict', 'Auto rename'))
-        self.file_conflict.setCurrentIndex(conflict_index if conflict_index >= 0 else 1)
-        
-        self.chunk_enabled.setChecked(settings.get('chunk_enabled', True))
-        self.chunk_count.setValue(settings.get('chunk_count', 4))
-        self.chunk_min_size.setValue(settings.get('chunk_min_size', 10))
-        self.chunk_count.setEnabled(self.chunk_enabled.isChecked())
-        self.chunk_min_size.setEnabled(self.chunk_enabled.isChecked())
-        
-        # Connection settings
-        self.connection_timeout.setValue(settings.get('connection_timeout', 30))
-        self.retry_count.setValue(settings.get('retry_count', 3))
-        self.retry_delay.setValue(settings.get('retry_delay', 5))
-        
-        agent_index = self.user_agent_type.findText(settings.get('user_agent_type', 'Browser default'))
-        self.user_agent_type.setCurrentIndex(agent_index if agent_index >= 0 else 0)
-        
-        self.custom_user_agent.setText(settings.get('custom_user_agent', ''))
-        self.custom_user_agent.setEnabled(self.user_agent_type.currentText() == 'Custom')
-        
-        self.send_referer.setChecked(settings.get('send_referer', True))
-        
-        # Security settings
-        self.scan_downloads.setChecked(settings.get('scan_downloads', True))
-        
-        scanner_index = self.scanner_type.findText(settings.get('scanner_type', 'Built-in'))
-        self.scanner_type.setCurrentIndex(scanner_index if scanner_index >= 0 else 0)
-        
-        self.custom_scanner.setText(settings.get('custom_scanner', ''))
-        
-        malware_index = self.malware_action.findText(settings.get('malware_action', 'Ask user'))
-        self.malware_action.setCurrentIndex(malware_index if malware_index >= 0 else 0)
-        
-        self.block_dangerous.setChecked(settings.get('block_dangerous', True))
-        self.max_file_size_enabled.setChecked(settings.get('max_file_size_enabled', False))
-        self.max_file_size.setValue(settings.get('max_file_size', 10000))
-        self.max_file_size.setEnabled(self.max_file_size_enabled.isChecked())
-        
-        self.use_sandbox.setChecked(settings.get('use_sandbox', False))
-        self.open_in_sandbox.setChecked(settings.get('open_in_sandbox', False))
+        g = settings.get
+
+        # Batch the whole load into one repaint; every setChecked/
+        # setValue would otherwise trigger its own style and layout pass
+        self.setUpdatesEnabled(False)
+        try:
+            self._load_general_settings(g)
+            self._load_download_settings(g)
+            self._load_connection_settings(g)
+            self._load_security_settings(g)
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _load_general_settings(self, g):
+        self.start_minimized.setChecked(g('start_minimized', False))
+        self.check_updates.setChecked(g('check_updates', True))
+
+        self.notifications.setChecked(g('notifications', True))
+
+        # Expand the tilde once here so the stored path is canonical
+        # and downstream consumers never re-expand it
+        self.download_folder.setText(
+            os.path.expanduser(g('download_folder', '~/Downloads')))
+
+    def _load_download_settings(self, g):
+        with _signals_blocked(self.speed_limit_enabled, self.chunk_enabled):
+            self.max_downloads.setValue(g('max_downloads', 3))
+            self.speed_limit_enabled.setChecked(g('speed_limit_enabled', False))
+            self.speed_limit.setValue(g('speed_limit', 1000))
+            self.speed_limit.setEnabled(self.speed_limit_enabled.isChecked())
+
+            self.auto_extract.setChecked(g('auto_extract', True))
+            self.verify_hash.setChecked(g('verify_hash', True))
+
+            self.file_conflict.setCurrentIndex(
+                _FILE_CONFLICT_INDEX.get(g('file_conflict', 'Auto rename'), 1))
+
+            self.chunk_enabled.setChecked(g('chunk_enabled', True))
+            self.chunk_count.setValue(g('chunk_count', 4))
+            self.chunk_min_size.setValue(g('chunk_min_size', 10))
+            self.chunk_count.setEnabled(self.chunk_enabled.isChecked())
+            self.chunk_min_size.setEnabled(self.chunk_enabled.isChecked())
+
+    def _load_connection_settings(self, g):
+        with _signals_blocked(self.user_agent_type):
+            self.connection_timeout.setValue(g('connection_timeout', 30))
+            self.retry_count.setValue(g('retry_count', 3))
+            self.retry_delay.setValue(g('retry_delay', 5))
+
+            self.user_agent_type.setCurrentIndex(
+                _USER_AGENT_INDEX.get(g('user_agent_type', 'Browser default'), 0))
+
+            self.custom_user_agent.setText(g('custom_user_agent', ''))
+            self.custom_user_agent.setEnabled(self.user_agent_type.currentText() == 'Custom')
+
+            self.send_referer.setChecked(g('send_referer', True))
+
+    def _load_security_settings(self, g):
+        with _signals_blocked(self.max_file_size_enabled):
+            self.scan_downloads.setChecked(g('scan_downloads', True))
+
+            self.scanner_type.setCurrentIndex(
+                _SCANNER_TYPE_INDEX.get(g('scanner_type', 'Built-in'), 0))
+
+            self.custom_scanner.setText(g('custom_scanner', ''))
+
+            self.malware_action.setCurrentIndex(
+                _MALWARE_ACTION_INDEX.get(g('malware_action', 'Ask user'), 0))
+
+            self.block_dangerous.setChecked(g('block_dangerous', True))
+            self.max_file_size_enabled.setChecked(g('max_file_size_enabled', False))
+            self.max_file_size.setValue(g('max_file_size', 10000))
+            self.max_file_size.setEnabled(self.max_file_size_enabled.isChecked())
+
+            self.use_sandbox.setChecked(g('use_sandbox', False))
+            self.open_in_sandbox.setChecked(g('open_in_sandbox', False))
     
+    @pyqtSlot(bool)
+    def _on_speed_limit_toggled(self, enabled):
+        # Enable/disable the speed limit value field
+        self.speed_limit.setEnabled(enabled)
+
+    @pyqtSlot(bool)
+    def _on_chunk_toggled(self, enabled):
+        # Enable/disable both chunk parameter fields with one dispatch
+        self.chunk_count.setEnabled(enabled)
+        self.chunk_min_size.setEnabled(enabled)
+
+    @pyqtSlot(bool)
+    def _on_max_size_toggled(self, enabled):
+        # Enable/disable the maximum file size field
+        self.max_file_size.setEnabled(enabled)
+
+    @pyqtSlot()
     def browse_download_folder(self):
-        # Open folder selection dialog
-        folder = QFileDialog.getExistingDirectory(
-            self, 
-            "Select Download Folder", 
-            self.download_folder.text() or "~/"
-        )
-        
-        if folder:
-            self.download_folder.setText(folder)
+        # Build the folder dialog once; the static getExistingDirectory
+        # constructs a fresh native dialog on every click
+        if self._folder_dialog is None:
+            self._folder_dialog = QFileDialog(self, "Select Download Folder")
+            self._folder_dialog.setFileMode(QFileDialog.Directory)
+            self._folder_dialog.setOption(QFileDialog.ShowDirsOnly, True)
+
+        self._folder_dialog.setDirectory(
+            self.download_folder.text() or os.path.expanduser("~"))
+
+        if self._folder_dialog.exec_():
+            self.download_folder.setText(self._folder_dialog.selectedFiles()[0])
     
     @pyqtSlot(int)
     def on_user_agent_changed(self, index):
         # Enable/disable custom user agent field
         self.custom_user_agent.setEnabled(self.user_agent_type.currentText() == 'Custom')
     
+    @pyqtSlot()
     def save_settings(self):
-        # Collect all settings
-        general_settings = {
-            'start_minimized': self.start_minimized.isChecked(),
-            'check_updates': self.check_updates.isChecked(),
-            'notifications': self.notifications.isChecked(),
-            'download_folder': self.download_folder.text(),
-        }
-        
-        download_settings = {
-            'max_downloads': self.max_downloads.value(),
-            'speed_limit_enabled': self.speed_limit_enabled.isChecked(),
-            'speed_limit': self.speed_limit.value(),
-            'auto_extract': self.auto_extract.isChecked(),
-            'verify_hash': self.verify_hash.isChecked(),
-            'file_conflict': self.file_conflict.currentText(),
-            'chunk_enabled': self.chunk_enabled.isChecked(),
-            'chunk_count': self.chunk_count.value(),
-            'chunk_min_size': self.chunk_min_size.value(),
+        # Serialize every section from the table built during setup.
+        # One save_all call schedules a single write for all sections.
+        payload = {
+            section: {key: read() for key, read in items}
+            for section, items in self._serial_map.items()
         }
-        
-        connection_settings = {
-            'connection_timeout': self.connection_timeout.value(),
-            'retry_count': self.retry_count.value(),
-            'retry_delay': self.retry_delay.value(),
-            'user_agent_type': self.user_agent_type.currentText(),
-            'custom_user_agent': self.custom_user_agent.text(),
-            'send_referer': self.send_referer.isChecked(),
-        }
-        
-        security_settings = {
-            'scan_downloads': self.scan_downloads.isChecked(),
-            'scanner_type': self.scanner_type.currentText(),
-            'custom_scanner': self.custom_scanner.text(),
-            'malware_action': self.malware_action.currentText(),
-            'block_dangerous': self.block_dangerous.isChecked(),
-            'max_file_size_enabled': self.max_file_size_enabled.isChecked(),
-            'max_file_size': self.max_file_size.value(),
-            'use_sandbox': self.use_sandbox.isChecked(),
-            'open_in_sandbox': self.open_in_sandbox.isChecked()
-        }
-        
-        # Save each section separately
-        self.settings_manager.save_section('general', general_settings)
-        self.settings_manager.save_section('download', download_settings)
-        self.settings_manager.save_section('connection', connection_settings)
-        self.settings_manager.save_section('security', security_settings)
-        
-        # Show success message
-        QMessageBox.information(self, "Settings", "Settings saved successfully.") 
\ No newline at end of file
+        self.settings_manager.save_all(payload)
+
+        # Show a success notice that clears itself shortly after
+        self._save_notice.setText("Settings saved.")
+        QTimer.singleShot(2500, self._save_notice.clear)
\ No newline at end of file